@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import csv
+import heapq
+import json
+import struct
+import sys
+import tempfile
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# A run record is: key (float64) + sequence number (uint64) + one
+# length-prefixed UTF-8 string per non-key column.
+_HEAD = struct.Struct("<dQ")
+_LEN = struct.Struct("<I")
+
+# rough per-record cost of the in-memory buffer beyond the strings themselves
+# (dict/tuple/float objects and list slot)
+_RECORD_OVERHEAD = 256
+# per-file buffer range for run files; the merge holds fan_in + 1 of them
+_IO_BUFFER = 1 << 16
+_MIN_IO_BUFFER = 1 << 10
+MAX_FAN_IN = 64
+
+_SIZE_UNITS = {"": 1, "K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(text: str) -> int:
+    """'512M' -> 536870912. Accepts plain bytes or a K/M/G suffix (optional 'B')."""
+    s = text.strip().upper().removesuffix("B")
+    unit = s[-1:] if s[-1:] in _SIZE_UNITS else ""
+    try:
+        value = float(s[: len(s) - len(unit)])
+    except ValueError:
+        raise ValueError(f"invalid size: {text!r}") from None
+    if value <= 0:
+        raise ValueError(f"size must be positive: {text!r}")
+    return int(value * _SIZE_UNITS[unit])
+
+
+_Item = Tuple[float, int, Tuple[str, ...]]
+
+
+def merge_plan(memory_budget: int, max_fan_in: int = MAX_FAN_IN) -> Tuple[int, int]:
+    """
+    (fan_in, io_buffer) so that one merge pass, fan_in input runs plus the
+    output file, buffers about memory_budget bytes. Budgets below
+    3 * _MIN_IO_BUFFER still merge 2 runs at a time with the minimum buffer.
+    """
+    fan_in = max(2, min(max_fan_in, memory_budget // _MIN_IO_BUFFER - 1))
+    io_buffer = max(_MIN_IO_BUFFER, min(_IO_BUFFER, memory_budget // (fan_in + 1)))
+    return fan_in, io_buffer
+
+
+def _write_run(items: Iterable[_Item], path: Path, buffering: int = _IO_BUFFER) -> None:
+    with open(path, "wb", buffering=buffering) as f:
+        for key, seq, values in items:
+            f.write(_HEAD.pack(key, seq))
+            for v in values:
+                b = v.encode("utf-8")
+                f.write(_LEN.pack(len(b)))
+                f.write(b)
+
+
+def _read_run(path: Path, n_values: int, buffering: int = _IO_BUFFER) -> Iterator[_Item]:
+    with open(path, "rb", buffering=buffering) as f:
+        while True:
+            head = f.read(_HEAD.size)
+            if not head:
+                return
+            key, seq = _HEAD.unpack(head)
+            values = []
+            for _ in range(n_values):
+                (n,) = _LEN.unpack(f.read(_LEN.size))
+                values.append(f.read(n).decode("utf-8"))
+            yield key, seq, tuple(values)
+
+
+class ExternalSorter:
+    """
+    Stable sort of records by a float key with bounded memory.
+
+    Non-key values are stored and returned as strings.
+
+    Records are buffered until the estimated buffer size reaches memory_budget,
+    then sorted and spilled to a binary run file. Runs are k-way merged on
+    (key, arrival order), which gives exactly the order of a stable in-memory
+    sort (pandas kind="mergesort"). The merge fan-in and file buffers come
+    from merge_plan(memory_budget), capped at max_fan_in; more runs than that
+    are merged in several passes so open files and buffers stay bounded.
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        key: str = "slack",
+        memory_budget: int = 256 << 20,
+        tmpdir: Optional[str | Path] = None,
+        max_fan_in: int = MAX_FAN_IN,
+    ):
+        if key not in columns:
+            raise ValueError(f"key column {key!r} not in columns")
+        if max_fan_in < 2:
+            raise ValueError("max_fan_in must be >= 2")
+        self.columns = list(columns)
+        self.key = key
+        self.value_columns = [c for c in self.columns if c != key]
+        self.memory_budget = memory_budget
+        self.tmpdir = tmpdir
+        self.fan_in, self.io_buffer = merge_plan(memory_budget, max_fan_in)
+        self.n_runs = 0
+
+    def _to_record(self, key: float, values: Tuple[str, ...]) -> Dict[str, Any]:
+        rec: Dict[str, Any] = dict(zip(self.value_columns, values))
+        rec[self.key] = key
+        return {c: rec[c] for c in self.columns}
+
+    def sort(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        with tempfile.TemporaryDirectory(prefix="edaflow-sort-", dir=self.tmpdir) as tmp:
+            tmp_path = Path(tmp)
+            runs: List[Path] = []
+            buf: List[_Item] = []
+            buf_bytes = 0
+
+            for seq, rec in enumerate(records):
+                values = tuple(str(rec[c]) for c in self.value_columns)
+                buf.append((float(rec[self.key]), seq, values))
+                buf_bytes += _RECORD_OVERHEAD + sum(sys.getsizeof(v) for v in values)
+                if buf_bytes >= self.memory_budget:
+                    buf.sort(key=lambda it: (it[0], it[1]))
+                    runs.append(tmp_path / f"run{len(runs):06d}.bin")
+                    _write_run(buf, runs[-1], self.io_buffer)
+                    buf = []
+                    buf_bytes = 0
+
+            buf.sort(key=lambda it: (it[0], it[1]))
+            self.n_runs = len(runs)
+            if not runs:
+                # everything fit in the budget: no disk round trip
+                for key, _, values in buf:
+                    yield self._to_record(key, values)
+                return
+            if buf:
+                runs.append(tmp_path / f"run{len(runs):06d}.bin")
+                _write_run(buf, runs[-1], self.io_buffer)
+                buf = []
+                self.n_runs = len(runs)
+
+            n_values = len(self.value_columns)
+            bufsize = self.io_buffer
+            n_merged = 0
+            while len(runs) > self.fan_in:
+                next_runs: List[Path] = []
+                for i in range(0, len(runs), self.fan_in):
+                    group = runs[i : i + self.fan_in]
+                    out = tmp_path / f"merge{n_merged:06d}.bin"
+                    n_merged += 1
+                    _write_run(
+                        heapq.merge(*(_read_run(p, n_values, bufsize) for p in group)),
+                        out,
+                        bufsize,
+                    )
+                    for p in group:
+                        p.unlink()
+                    next_runs.append(out)
+                runs = next_runs
+
+            for key, _, values in heapq.merge(
+                *(_read_run(p, n_values, bufsize) for p in runs)
+            ):
+                yield self._to_record(key, values)
+
+
+class TopK:
+    """
+    The k smallest records by key, ties kept in arrival order: the same rows
+    as a stable sort followed by head(k), holding only k records at a time.
+    """
+
+    def __init__(self, k: int, key: str = "slack"):
+        self.k = max(k, 0)
+        self.key = key
+        # max-heap on (key, seq) via negation; seq is unique so dicts never compare
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._seq = 0
+
+    def add(self, rec: Dict[str, Any]) -> None:
+        item = (-float(rec[self.key]), -self._seq, rec)
+        self._seq += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, item)
+        elif self._heap and item > self._heap[0]:
+            heapq.heapreplace(self._heap, item)
+
+    def items(self) -> List[Dict[str, Any]]:
+        return [rec for _, _, rec in sorted(self._heap, reverse=True)]
+
+
+def write_csv_stream(
+    records: Iterable[Dict[str, Any]], columns: Sequence[str], out: IO[str]
+) -> None:
+    w = csv.DictWriter(out, fieldnames=list(columns), lineterminator="\n")
+    w.writeheader()
+    for rec in records:
+        w.writerow(rec)
+
+
+def write_ndjson_stream(records: Iterable[Dict[str, Any]], out: IO[str]) -> None:
+    for rec in records:
+        out.write(json.dumps(rec))
+        out.write("\n")
+
+
+def external_sort_to_file(
+    records: Iterable[Dict[str, Any]],
+    columns: Sequence[str],
+    out_path: str | Path,
+    fmt: str = "csv",
+    key: str = "slack",
+    memory_budget: int = 256 << 20,
+    tmpdir: Optional[str | Path] = None,
+) -> Path:
+    """Sort records by key (stable) through ExternalSorter into a CSV or NDJSON file."""
+    if fmt not in ("csv", "ndjson"):
+        raise ValueError(f"unsupported format: {fmt!r}")
+    out_path = Path(out_path)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+
+    sorter = ExternalSorter(columns, key=key, memory_budget=memory_budget, tmpdir=tmpdir)
+    with open(out_path, "w", encoding="utf-8", newline="") as f:
+        if fmt == "csv":
+            write_csv_stream(sorter.sort(records), columns, f)
+        else:
+            write_ndjson_stream(sorter.sort(records), f)
+    return out_path
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# One row per (run, corner) and per (run, corner, path_group). Rows are only ever
+# inserted; trend queries hit the (corner, ts) / (path_group, ts) indexes and never
+# touch per-path artifacts.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT NOT NULL,
+    corner TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    report TEXT NOT NULL,
+    total_paths INTEGER NOT NULL,
+    violated_paths INTEGER NOT NULL,
+    met_paths INTEGER NOT NULL,
+    wns REAL NOT NULL,
+    tns REAL NOT NULL,
+    PRIMARY KEY (run_id, corner)
+);
+CREATE INDEX IF NOT EXISTS runs_ts ON runs (ts);
+CREATE INDEX IF NOT EXISTS runs_corner_ts ON runs (corner, ts);
+
+CREATE TABLE IF NOT EXISTS run_groups (
+    run_id TEXT NOT NULL,
+    corner TEXT NOT NULL,
+    ts TEXT NOT NULL,
+    path_group TEXT NOT NULL,
+    total_paths INTEGER NOT NULL,
+    violated_paths INTEGER NOT NULL,
+    met_paths INTEGER NOT NULL,
+    wns REAL NOT NULL,
+    tns REAL NOT NULL,
+    PRIMARY KEY (run_id, corner, path_group)
+);
+CREATE INDEX IF NOT EXISTS run_groups_group_ts ON run_groups (path_group, ts);
+"""
+
+_STAT_COLS = ("total_paths", "violated_paths", "met_paths", "wns", "tns")
+
+
+def default_run_id(ts: datetime) -> str:
+    return ts.strftime("%Y%m%d-%H%M%S")
+
+
+class RunHistory:
+    """
+    Append-only local store of per-run summaries (SQLite, stdlib only).
+
+    Usage:
+        with RunHistory("history/edaflow.db") as h:
+            h.append_run(summarize(paths), report="timing_report.txt")
+            h.run_trend(limit=30)
+    """
+
+    def __init__(self, db_path: str | Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.row_factory = sqlite3.Row
+        # readers (the dashboard) don't block the nightly writer
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> RunHistory:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def append_run(
+        self,
+        summary: Dict[str, Any],
+        report: str,
+        run_id: Optional[str] = None,
+        corner: str = "default",
+        ts: Optional[datetime] = None,
+    ) -> str:
+        """
+        Record one summarize() result. Returns the run id.
+        Raises ValueError if (run_id, corner) was already recorded.
+        """
+        ts = ts or datetime.now()
+        run_id = run_id or default_run_id(ts)
+        ts_s = ts.isoformat(timespec="seconds")
+
+        overall = summary["overall"]
+        group_rows = [
+            (run_id, corner, ts_s, g, *(st[c] for c in _STAT_COLS))
+            for g, st in sorted(summary["by_path_group"].items())
+        ]
+        try:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, corner, ts_s, report, *(overall[c] for c in _STAT_COLS)),
+                )
+                self._conn.executemany(
+                    "INSERT INTO run_groups VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    group_rows,
+                )
+        except sqlite3.IntegrityError as e:
+            raise ValueError(
+                f"run {run_id!r} / corner {corner!r} already exists in {self.db_path}"
+            ) from e
+        return run_id
+
+    def has_run(self, run_id: str, corner: str = "default") -> bool:
+        row = self._conn.execute(
+            "SELECT 1 FROM runs WHERE run_id = ? AND corner = ?", (run_id, corner)
+        ).fetchone()
+        return row is not None
+
+    def _query(self, sql: str, params: tuple, limit: Optional[int]) -> List[Dict[str, Any]]:
+        # newest N first via the index, then hand back in chronological order
+        if limit is not None:
+            sql += " LIMIT ?"
+            params = (*params, limit)
+        rows = [dict(r) for r in self._conn.execute(sql, params)]
+        rows.reverse()
+        return rows
+
+    def run_trend(
+        self, corner: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Overall stats per run (summed over corners unless one is given)."""
+        if corner is not None:
+            return self._query(
+                "SELECT run_id, ts, corner, report, total_paths, violated_paths, "
+                "met_paths, wns, tns FROM runs WHERE corner = ? ORDER BY ts DESC",
+                (corner,),
+                limit,
+            )
+        return self._query(
+            "SELECT run_id, MIN(ts) AS ts, COUNT(*) AS corners, "
+            "SUM(total_paths) AS total_paths, SUM(violated_paths) AS violated_paths, "
+            "SUM(met_paths) AS met_paths, MIN(wns) AS wns, SUM(tns) AS tns "
+            "FROM runs GROUP BY run_id ORDER BY ts DESC",
+            (),
+            limit,
+        )
+
+    def group_trend(
+        self, path_group: str, corner: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Stats of one path group per run (summed over corners unless one is given)."""
+        if corner is not None:
+            return self._query(
+                "SELECT run_id, ts, corner, total_paths, violated_paths, met_paths, wns, tns "
+                "FROM run_groups WHERE path_group = ? AND corner = ? ORDER BY ts DESC",
+                (path_group, corner),
+                limit,
+            )
+        return self._query(
+            "SELECT run_id, MIN(ts) AS ts, COUNT(*) AS corners, "
+            "SUM(total_paths) AS total_paths, SUM(violated_paths) AS violated_paths, "
+            "SUM(met_paths) AS met_paths, MIN(wns) AS wns, SUM(tns) AS tns "
+            "FROM run_groups WHERE path_group = ? GROUP BY run_id ORDER BY ts DESC",
+            (path_group,),
+            limit,
+        )
+
+    def path_groups(self) -> List[str]:
+        sql = "SELECT DISTINCT path_group FROM run_groups ORDER BY path_group"
+        return [r[0] for r in self._conn.execute(sql)]
+
+    def corners(self) -> List[str]:
+        sql = "SELECT DISTINCT corner FROM runs ORDER BY corner"
+        return [r[0] for r in self._conn.execute(sql)]
+
+    def num_runs(self) -> int:
+        return int(self._conn.execute("SELECT COUNT(DISTINCT run_id) FROM runs").fetchone()[0])
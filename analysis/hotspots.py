@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from parser.timing_parser import TimingPath
+from typing import Dict, Iterable, List, Optional
+
+
+@dataclass
+class CellHotspot:
+    cell: str
+    path_count: int  # violating paths that pass through this cell
+    tns: float  # sum of slack over those paths
+    wns: float  # worst slack over those paths
+
+
+def cell_of_pin(pin: str) -> str:
+    # "U_TOP/U_COMB1/Z" -> "U_TOP/U_COMB1"
+    cell, sep, _ = pin.rpartition("/")
+    return cell if sep else pin
+
+
+class HotspotCounter:
+    """
+    Streaming per-cell coverage / TNS counter for violating paths.
+
+    Pin and cell names are interned to dense integer ids once; counters are
+    flat arrays indexed by cell id, so memory grows with the number of distinct
+    cells rather than with paths x stages.
+    """
+
+    def __init__(self) -> None:
+        self._pin_ids: Dict[str, int] = {}
+        self._pin_cell = array("l")  # pin id -> cell id
+        self._cell_ids: Dict[str, int] = {}
+        self._cell_names: List[str] = []
+        self._path_count = array("q")
+        self._tns = array("d")
+        self._wns = array("d")
+        self.n_paths = 0
+
+    def _cell_id(self, pin: str) -> int:
+        pid = self._pin_ids.get(pin)
+        if pid is not None:
+            return self._pin_cell[pid]
+
+        cell = cell_of_pin(pin)
+        cid = self._cell_ids.get(cell)
+        if cid is None:
+            cid = len(self._cell_names)
+            self._cell_ids[cell] = cid
+            self._cell_names.append(cell)
+            self._path_count.append(0)
+            self._tns.append(0.0)
+            self._wns.append(0.0)
+
+        self._pin_ids[pin] = len(self._pin_cell)
+        self._pin_cell.append(cid)
+        return cid
+
+    def add(self, slack: float, points: Iterable[str]) -> None:
+        if slack >= 0:
+            return
+        self.n_paths += 1
+        # a cell is counted once per path even if several of its pins are listed
+        for cid in {self._cell_id(pin) for pin in points}:
+            self._path_count[cid] += 1
+            self._tns[cid] += slack
+            if slack < self._wns[cid]:
+                self._wns[cid] = slack
+
+    def add_paths(self, paths: Iterable[TimingPath]) -> HotspotCounter:
+        for p in paths:
+            self.add(p.slack, p.points)
+        return self
+
+    @property
+    def n_cells(self) -> int:
+        return len(self._cell_names)
+
+    def ranked(self, top: Optional[int] = None) -> List[CellHotspot]:
+        """Most violating paths first; ties broken by worse TNS, then name."""
+        order = sorted(
+            range(self.n_cells),
+            key=lambda i: (-self._path_count[i], self._tns[i], self._cell_names[i]),
+        )
+        if top is not None:
+            order = order[:top]
+        return [
+            CellHotspot(
+                cell=self._cell_names[i],
+                path_count=self._path_count[i],
+                tns=self._tns[i],
+                wns=self._wns[i],
+            )
+            for i in order
+        ]
+
+
+def find_hotspots(
+    paths: Iterable[TimingPath], top: Optional[int] = None
+) -> List[CellHotspot]:
+    return HotspotCounter().add_paths(paths).ranked(top)
+
+
+if __name__ == "__main__":
+    import argparse
+    import json
+    from dataclasses import asdict
+    from parser.timing_parser import iter_report_file
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--report", required=True)
+    ap.add_argument("--top", type=int, default=20)
+    args = ap.parse_args()
+
+    hotspots = find_hotspots(iter_report_file(args.report), top=args.top)
+    print(json.dumps([asdict(h) for h in hotspots], indent=2))
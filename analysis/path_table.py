@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from analysis.hotspots import CellHotspot
+from analysis.search_index import PathSearchIndex
+from dataclasses import asdict
+from parser.violation_summary import infer_violation_type
+from typing import Iterable, Optional
+
+import pandas as pd
+
+PATH_COLUMNS = [
+    "startpoint",
+    "endpoint",
+    "path_group",
+    "path_type",
+    "slack",
+    "slack_status",
+    "notes",
+    "violation_type",
+]
+
+HOTSPOT_COLUMNS = ["cell", "path_count", "tns", "wns"]
+
+
+def path_record(p) -> dict:
+    return {
+        "startpoint": p.startpoint,
+        "endpoint": p.endpoint,
+        "path_group": p.path_group,
+        "path_type": p.path_type,
+        "slack": p.slack,
+        "slack_status": p.slack_status,
+        "notes": " ".join(p.notes),
+        "violation_type": infer_violation_type(p),
+    }
+
+
+def paths_to_df(paths) -> pd.DataFrame:
+    # explicit columns so a report with no paths still yields a usable (empty) frame
+    return pd.DataFrame([path_record(p) for p in paths], columns=PATH_COLUMNS)
+
+
+def hotspots_to_df(hotspots: Iterable[CellHotspot]) -> pd.DataFrame:
+    return pd.DataFrame([asdict(h) for h in hotspots], columns=HOTSPOT_COLUMNS)
+
+
+def filter_paths(
+    df: pd.DataFrame,
+    group: Optional[str],
+    violations_only: bool,
+    endpoint: Optional[str] = None,
+    index: Optional[PathSearchIndex] = None,
+) -> pd.DataFrame:
+    out = df.copy()
+
+    if endpoint:
+        # row ids from the search index are positions in df
+        index = index or PathSearchIndex.from_df(df)
+        out = out.iloc[index.search("endpoint", endpoint)]
+
+    if group:
+        out = out[out["path_group"] == group]
+
+    if violations_only:
+        out = out[out["slack"] < 0]
+
+    # stable sort: worst slack first
+    out = out.sort_values(by=["slack"], ascending=True, kind="mergesort").reset_index(
+        drop=True
+    )
+    return out
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import pandas as pd
+
+# slack below this (ns) is "near-critical" and always kept row-for-row
+NEAR_CRITICAL_NS = 0.05
+SAMPLE_PER_GROUP = 500
+
+_HASH_KEY = "edaflow-sample-0"  # hash_pandas_object needs exactly 16 chars
+
+
+def downsample_paths(
+    df: pd.DataFrame,
+    near_critical: float = NEAR_CRITICAL_NS,
+    per_group: int = SAMPLE_PER_GROUP,
+) -> pd.DataFrame:
+    """
+    Tail-preserving view of a paths frame for plotting / dashboards.
+
+    - every path with slack < near_critical is kept exactly (weight 1)
+    - the remaining (MET) bulk is sampled per path_group: at most per_group rows,
+      chosen by a content hash so the same paths are picked on every run
+    - sampled rows carry weight = group bulk size / rows kept, so weighted
+      counts and histograms match the full data in expectation
+
+    Returns the kept rows in their original order with an extra "weight" column.
+    """
+    if per_group < 1:
+        raise ValueError("per_group must be >= 1")
+
+    out = df.reset_index(drop=True)
+    out["weight"] = 1.0
+    if out.empty:
+        return out
+
+    tail = out["slack"] < near_critical
+    bulk = out[~tail]
+    if bulk.empty:
+        return out
+
+    h = pd.util.hash_pandas_object(
+        bulk[["startpoint", "endpoint", "path_group"]], index=False, hash_key=_HASH_KEY
+    )
+    ranked = bulk.assign(_h=h.to_numpy(), _pos=range(len(bulk)))
+    ranked = ranked.sort_values(["path_group", "_h", "_pos"], kind="mergesort")
+
+    keep = ranked.groupby("path_group", sort=False).head(per_group)
+    group_size = bulk.groupby("path_group").size()
+    kept_size = keep.groupby("path_group").size()
+    weights = keep["path_group"].map(group_size / kept_size).astype(float)
+
+    out.loc[keep.index, "weight"] = weights
+    drop = bulk.index.difference(keep.index)
+    return out.drop(index=drop)
+
+
+def weighted_counts(df: pd.DataFrame) -> float:
+    """Estimated number of paths represented by a (possibly sampled) frame."""
+    if "weight" in df.columns:
+        return float(df["weight"].sum())
+    return float(len(df))
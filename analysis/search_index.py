@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import bisect
+import json
+import re
+from array import array
+from parser.timing_parser import pin_name
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+# Only * and ? are wildcards. "[" is literal so bus bits like data_reg[3]
+# match as written (fnmatch would read [3] as a character class).
+_GLOB_CHARS = re.compile(r"[*?]")
+_GLOB_SPLIT = re.compile(r"\*|\?")
+
+GRAM = 3
+
+
+def is_glob(pattern: str) -> bool:
+    return bool(_GLOB_CHARS.search(pattern))
+
+
+def glob_regex(pattern: str) -> re.Pattern:
+    """* -> any run, ? -> any one character, everything else literal."""
+    parts = [".*" if c == "*" else "." if c == "?" else re.escape(c) for c in pattern]
+    return re.compile("".join(parts), re.DOTALL)
+
+
+def compile_matcher(pattern: str) -> Callable[[str], bool]:
+    """
+    Linear-scan equivalent of NameIndex.search() as a per-value predicate.
+    Build it once per pattern when testing many values.
+    """
+    if is_glob(pattern):
+        rx = glob_regex(pattern)
+        return lambda value: rx.fullmatch(pin_name(value)) is not None
+    return lambda value: pattern in pin_name(value)
+
+
+def matches(pattern: str, value: str) -> bool:
+    return compile_matcher(pattern)(value)
+
+
+def _grams(s: str) -> Set[str]:
+    return {s[i : i + GRAM] for i in range(len(s) - GRAM + 1)}
+
+
+class NameIndex:
+    """
+    Substring / prefix / glob search over a column of pin names.
+
+    Names are interned (one entry per distinct name, each with the row ids it
+    appears on), then indexed two ways:
+    - trigram -> sorted name ids, for substring and glob literals
+    - a sorted name list, for prefix ranges via bisect
+    Queries touch only candidate names and verify them, never every row.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.names: List[str] = []
+        self.rows: List[array] = []  # name id -> row ids (ascending)
+        ids: Dict[str, int] = {}
+        for row, value in enumerate(values):
+            name = pin_name(value)
+            nid = ids.get(name)
+            if nid is None:
+                nid = ids[name] = len(self.names)
+                self.names.append(name)
+                self.rows.append(array("l"))
+            self.rows[nid].append(row)
+        self._build()
+
+    def _build(self) -> None:
+        self._postings: Dict[str, array] = {}
+        for nid, name in enumerate(self.names):
+            for g in _grams(name):
+                self._postings.setdefault(g, array("l")).append(nid)
+        self._sorted_ids = sorted(range(len(self.names)), key=self.names.__getitem__)
+        self._sorted_names = [self.names[i] for i in self._sorted_ids]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    # ---- candidate generation ----
+
+    def _gram_candidates(self, literals: Iterable[str]) -> Optional[Set[int]]:
+        """Name ids containing every literal's trigrams; None if nothing to narrow on."""
+        grams = set()
+        for lit in literals:
+            grams |= _grams(lit)
+        if not grams:
+            return None
+        postings = []
+        for g in grams:
+            p = self._postings.get(g)
+            if p is None:
+                return set()
+            postings.append(p)
+        postings.sort(key=len)
+        cand = set(postings[0])
+        for p in postings[1:]:
+            cand.intersection_update(p)
+            if not cand:
+                break
+        return cand
+
+    def _prefix_ids(self, prefix: str) -> List[int]:
+        lo = bisect.bisect_left(self._sorted_names, prefix)
+        hi = bisect.bisect_left(self._sorted_names, prefix + "\U0010ffff", lo)
+        return self._sorted_ids[lo:hi]
+
+    # ---- name-level queries ----
+
+    def match_substring(self, text: str) -> List[int]:
+        cand = self._gram_candidates([text])
+        pool = range(len(self.names)) if cand is None else cand
+        return sorted(nid for nid in pool if text in self.names[nid])
+
+    def match_prefix(self, prefix: str) -> List[int]:
+        return sorted(self._prefix_ids(prefix))
+
+    def match_glob(self, pattern: str) -> List[int]:
+        literals = [lit for lit in _GLOB_SPLIT.split(pattern) if lit]
+        m = _GLOB_SPLIT.search(pattern)
+        lead = pattern[: m.start()] if m else pattern
+
+        pool: Optional[Set[int]] = self._gram_candidates(literals)
+        if lead:
+            prefixed = set(self._prefix_ids(lead))
+            pool = prefixed if pool is None else pool & prefixed
+        ids: Iterable[int] = range(len(self.names)) if pool is None else pool
+        rx = glob_regex(pattern)
+        return sorted(nid for nid in ids if rx.fullmatch(self.names[nid]))
+
+    # ---- row-level queries ----
+
+    def _rows(self, name_ids: Iterable[int]) -> List[int]:
+        out: List[int] = []
+        for nid in name_ids:
+            out.extend(self.rows[nid])
+        out.sort()
+        return out
+
+    def substring(self, text: str) -> List[int]:
+        return self._rows(self.match_substring(text))
+
+    def prefix(self, prefix: str) -> List[int]:
+        return self._rows(self.match_prefix(prefix))
+
+    def glob(self, pattern: str) -> List[int]:
+        return self._rows(self.match_glob(pattern))
+
+    def search(self, pattern: str) -> List[int]:
+        """Glob if the pattern has * or ?; otherwise substring. Returns row ids."""
+        return self.glob(pattern) if is_glob(pattern) else self.substring(pattern)
+
+    # ---- persistence ----
+
+    def to_dict(self) -> dict:
+        # CSR layout: rows of name i are row_ids[offsets[i]:offsets[i + 1]]
+        offsets = [0]
+        row_ids: List[int] = []
+        for r in self.rows:
+            row_ids.extend(r)
+            offsets.append(len(row_ids))
+        return {"names": self.names, "offsets": offsets, "row_ids": row_ids}
+
+    @classmethod
+    def from_dict(cls, d: dict) -> NameIndex:
+        idx = cls()
+        idx.names = list(d["names"])
+        off, row_ids = d["offsets"], d["row_ids"]
+        idx.rows = [array("l", row_ids[off[i] : off[i + 1]]) for i in range(len(idx.names))]
+        idx._build()
+        return idx
+
+
+class PathSearchIndex:
+    """Startpoint and endpoint NameIndex over the rows of paths.csv."""
+
+    FIELDS = ("startpoint", "endpoint")
+
+    def __init__(self, by_field: Dict[str, NameIndex]):
+        self.by_field = by_field
+
+    @classmethod
+    def from_df(cls, df) -> PathSearchIndex:
+        return cls({f: NameIndex(df[f].astype(str).tolist()) for f in cls.FIELDS})
+
+    def search(self, field: str, pattern: str) -> List[int]:
+        if field not in self.by_field:
+            raise ValueError(f"unknown field {field!r}; expected one of {self.FIELDS}")
+        return self.by_field[field].search(pattern)
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        obj = {f: idx.to_dict() for f, idx in self.by_field.items()}
+        path.write_text(json.dumps(obj, separators=(",", ":")), encoding="utf-8")
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> PathSearchIndex:
+        obj = json.loads(Path(path).read_text(encoding="utf-8"))
+        return cls({f: NameIndex.from_dict(d) for f, d in obj.items()})
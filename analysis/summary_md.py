@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Sequence
+
+import pandas as pd
+
+# files edaflow.py writes next to summary.md
+ARTIFACTS = (
+    "paths.json",
+    "paths.csv",
+    "paths_sampled.csv",
+    "search_index.json",
+    "summary.json",
+    "top_violations.csv",
+    "hotspots.csv",
+    "slack_distribution.png",
+)
+
+
+def build_summary_md(
+    report_path: Path,
+    df_all: pd.DataFrame,
+    df_view: pd.DataFrame,
+    outdir: Optional[Path],
+    topk: int,
+    hotspots_df: Optional[pd.DataFrame] = None,
+    artifacts: Sequence[str] = ARTIFACTS,
+) -> str:
+    # overall stats from ALL parsed paths (not filtered)
+    # (You can change this to filtered-only if you prefer)
+    # We'll display both overall and current view
+
+    # Rebuild TimingPath list for stats (small dataset; ok)
+    # If you want to avoid this, compute directly from df.
+    # We'll compute from df for simplicity:
+    def stats_from_df(df: pd.DataFrame) -> dict:
+        total = int(len(df))
+        violated = int((df["slack"] < 0).sum())
+        met = total - violated
+        wns = float(df["slack"].min()) if violated > 0 else 0.0
+        tns = float(df.loc[df["slack"] < 0, "slack"].sum()) if violated > 0 else 0.0
+        return {
+            "total_paths": total,
+            "violated_paths": violated,
+            "met_paths": met,
+            "wns": wns,
+            "tns": tns,
+        }
+
+    overall = stats_from_df(df_all)
+    view = stats_from_df(df_view)
+
+    # Group breakdown (ALL)
+    by_group = (
+        df_all.assign(is_viol=(df_all["slack"] < 0))
+        .groupby("path_group")
+        .agg(
+            total_paths=("slack", "size"),
+            violated_paths=("is_viol", "sum"),
+            wns=("slack", "min"),
+            tns=("slack", lambda s: float(s[s < 0].sum())),
+        )
+        .reset_index()
+        .sort_values(by=["wns"], ascending=True)
+    )
+
+    # Violation type counts (ALL)
+    vio_types = (
+        df_all[df_all["violation_type"] != "none"]
+        .groupby("violation_type")
+        .size()
+        .reset_index(name="count")
+        .sort_values("count", ascending=False)
+    )
+
+    # TopK table (VIEW)
+    top_df = df_view.head(topk).copy()
+    if len(top_df) == 0:
+        top_md = "_No paths match current filters._"
+    else:
+        top_df = top_df[
+            ["slack", "path_group", "violation_type", "startpoint", "endpoint", "notes"]
+        ]
+        # Keep markdown compact
+        top_md = top_df.to_markdown(index=False)
+
+    # Cell hotspots (ALL violating paths)
+    if hotspots_df is not None and len(hotspots_df):
+        hotspots_md = hotspots_df.head(10).to_markdown(index=False)
+    else:
+        hotspots_md = "_No cells found on violating paths._"
+
+    # Helpful artifact links (relative); outdir=None / no artifacts when nothing is written
+    # to disk (e.g. served by `edaflow.py serve`)
+    if artifacts:
+        artifacts_md = "\n".join(f"- `{name}`" for name in artifacts)
+    else:
+        artifacts_md = "_No files written (served by `edaflow.py serve`)._"
+    outdir_md = f"\n- Output directory: `{outdir.as_posix()}`" if outdir is not None else ""
+    top_ref = (
+        "`top_violations.csv`" if "top_violations.csv" in artifacts else "the Top paths table"
+    )
+
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    summary = f"""# Signoff Summary (edaflow-lite)
+
+- Report: `{report_path.name}`
+- Generated: `{now}`{outdir_md}
+
+## Overall (all parsed paths)
+
+- Total paths: **{overall["total_paths"]}**
+- Violated paths: **{overall["violated_paths"]}**
+- MET paths: **{overall["met_paths"]}**
+- WNS: **{overall["wns"]:.4f} ns**
+- TNS: **{overall["tns"]:.4f} ns**
+
+## Current View (after filters)
+
+- Total paths: **{view["total_paths"]}**
+- Violated paths: **{view["violated_paths"]}**
+- MET paths: **{view["met_paths"]}**
+- WNS: **{view["wns"]:.4f} ns**
+- TNS: **{view["tns"]:.4f} ns**
+
+## Breakdown by Path Group (all)
+
+{by_group.to_markdown(index=False)}
+
+## Violation Type Counts (all)
+
+{(vio_types.to_markdown(index=False) if len(vio_types) else "_No violation types inferred._")}
+
+## Top {topk} Worst Paths (current view)
+
+{top_md}
+
+## Cell Hotspots (violating paths, all)
+
+{hotspots_md}
+
+## Artifacts
+
+{artifacts_md}
+
+## Recommended Actions (triage)
+
+1. Start with **worst WNS** paths in {top_ref} and confirm whether they are dominated by logic depth vs. clock uncertainty.
+2. If violations cluster in a single `path_group`, prioritize **group-level constraints** and **clock tree assumptions**.
+3. If inferred types show `transition` / `max_capacitance`, validate **slew/cap constraints** and fix high-fanout nets first.
+
+"""
+    return summary
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+import hashlib
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import pandas as pd
 import streamlit as st
 
+from analysis.history import RunHistory
+from analysis.sampling import weighted_counts
+from analysis.search_index import PathSearchIndex
+from server.client import load_artifacts_from_server
+
 
 def stats_from_df(df: pd.DataFrame) -> dict:
-    total = int(len(df))
+    # paths_sampled.csv rows stand for "weight" paths; violations are always weight 1
+    total = int(round(weighted_counts(df)))
     violated = int((df["slack"] < 0).sum())
     met = total - violated
     wns = float(df["slack"].min()) if violated > 0 else 0.0
@@ -17,9 +24,14 @@ def stats_from_df(df: pd.DataFrame) -> dict:
 
 
 def compute_view(
-    df: pd.DataFrame, group: Optional[str], violations_only: bool
+    df: pd.DataFrame,
+    group: Optional[str],
+    violations_only: bool,
+    rows: Optional[List[int]] = None,
 ) -> pd.DataFrame:
     out = df.copy()
+    if rows is not None:
+        out = out.iloc[rows]
     if group:
         out = out[out["path_group"] == group]
     if violations_only:
@@ -31,9 +43,10 @@ def compute_view(
 
 
 @st.cache_data(show_spinner=False)
-def load_artifacts(outdir: str) -> dict:
+def load_artifacts(outdir: str, full: bool = False) -> dict:
     out = Path(outdir)
     paths_csv = out / "paths.csv"
+    sampled_csv = out / "paths_sampled.csv"
     top_csv = out / "top_violations.csv"
     summary_md = out / "summary.md"
     slack_png = out / "slack_distribution.png"
@@ -43,29 +56,136 @@ def load_artifacts(outdir: str) -> dict:
             f"Missing: {paths_csv}. Run edaflow.py to generate artifacts first."
         )
 
-    df_all = pd.read_csv(paths_csv)
+    # default to the tail-preserving sample; the full table only on request
+    sampled = not full and sampled_csv.exists()
+    df_all = pd.read_csv(sampled_csv if sampled else paths_csv)
 
     df_top = pd.read_csv(top_csv) if top_csv.exists() else pd.DataFrame()
     md = summary_md.read_text(encoding="utf-8") if summary_md.exists() else ""
     png_path = slack_png if slack_png.exists() else None
 
-    return {"df_all": df_all, "df_top": df_top, "md": md, "png_path": png_path}
+    return {
+        "df_all": df_all,
+        "df_top": df_top,
+        "md": md,
+        "png_path": png_path,
+        "sampled": sampled,
+    }
+
+
+def names_key(df: pd.DataFrame) -> str:
+    """Content key of the searchable columns, in row order (row ids depend on it)."""
+    h = pd.util.hash_pandas_object(df[list(PathSearchIndex.FIELDS)], index=False)
+    return hashlib.sha1(h.to_numpy().tobytes()).hexdigest()
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def get_search_index(
+    source: str, index_path: Optional[str], _df: pd.DataFrame
+) -> PathSearchIndex:
+    # search_index.json from edaflow.py matches paths.csv row order; any other
+    # view (sample, server) gets an index built over its own rows
+    if index_path is not None and Path(index_path).exists():
+        return PathSearchIndex.load(index_path)
+    return PathSearchIndex.from_df(_df)
+
+
+@st.cache_data(show_spinner=False, ttl=10)
+def load_from_server(server_url: str, full: bool = False) -> dict:
+    # the daemon re-parses on report changes; a short ttl picks that up
+    return load_artifacts_from_server(server_url, full=full)
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def load_trend(
+    db_path: str, group: Optional[str], corner: Optional[str], limit: int
+) -> pd.DataFrame:
+    # summary rows only; never touches per-path artifacts
+    with RunHistory(db_path) as history:
+        if group:
+            rows = history.group_trend(group, corner=corner, limit=limit)
+        else:
+            rows = history.run_trend(corner=corner, limit=limit)
+    return pd.DataFrame(rows)
+
+
+def trend_page():
+    st.title("edaflow-lite — Run History (Trend)")
+
+    st.sidebar.header("History")
+    db_path = st.sidebar.text_input("history db", value="history/edaflow.db")
+    if not Path(db_path).exists():
+        st.info(
+            "No run history yet. Record runs with:\n\n"
+            "python edaflow.py --report reports/timing_report.txt --outdir out "
+            "--history history/edaflow.db"
+        )
+        st.stop()
+
+    with RunHistory(db_path) as history:
+        groups = history.path_groups()
+        corners = history.corners()
+
+    group_choice = st.sidebar.selectbox("Path group", ["(all)"] + groups, index=0)
+    corner_choice = st.sidebar.selectbox("Corner", ["(all)"] + corners, index=0)
+    limit = st.sidebar.slider("Last N runs", min_value=5, max_value=1000, value=60, step=5)
+
+    df = load_trend(
+        db_path,
+        None if group_choice == "(all)" else group_choice,
+        None if corner_choice == "(all)" else corner_choice,
+        limit,
+    )
+    if df.empty:
+        st.warning("No runs match the current selection.")
+        st.stop()
+
+    latest = df.iloc[-1]
+    c1, c2, c3 = st.columns(3)
+    c1.metric("Latest WNS (ns)", f"{latest['wns']:.4f}")
+    c2.metric("Latest TNS (ns)", f"{latest['tns']:.4f}")
+    c3.metric("Latest Violations", f"{latest['violated_paths']}/{latest['total_paths']}")
+
+    df = df.set_index("ts")
+    st.subheader("WNS / TNS (ns)")
+    st.line_chart(df[["wns", "tns"]])
+    st.subheader("Violated paths")
+    st.line_chart(df[["violated_paths"]])
+
+    st.subheader("Runs")
+    st.dataframe(df.reset_index(), use_container_width=True)
 
 
 def main():
     st.set_page_config(page_title="edaflow-lite", layout="wide")
+
+    page = st.sidebar.radio("Page", ["Dashboard", "Trend"], index=0)
+    if page == "Trend":
+        trend_page()
+        return
+
     st.title("edaflow-lite — Signoff Dashboard (Artifact Viewer)")
 
     st.sidebar.header("Artifacts")
-    outdir = st.sidebar.text_input("outdir", value="out")
+    backend = st.sidebar.radio("Backend", ["outdir", "edaflow serve"], index=0)
+    if backend == "outdir":
+        outdir = st.sidebar.text_input("outdir", value="out")
+    else:
+        server_url = st.sidebar.text_input("server url", value="http://127.0.0.1:8765")
+    load_full = st.sidebar.checkbox("Load all paths (no sampling)", value=False)
     reload_btn = st.sidebar.button("Reload artifacts")
 
     # Reload trigger
     if reload_btn:
         load_artifacts.clear()
+        load_from_server.clear()
+        get_search_index.clear()
 
     try:
-        artifacts = load_artifacts(outdir)
+        if backend == "outdir":
+            artifacts = load_artifacts(outdir, full=load_full)
+        else:
+            artifacts = load_from_server(server_url, full=load_full)
     except Exception as e:
         st.error(str(e))
         st.info(
@@ -76,11 +196,18 @@ def main():
     df_all: pd.DataFrame = artifacts["df_all"]
     md: str = artifacts["md"]
     png_path = artifacts["png_path"]
+    sampled = artifacts.get("sampled", False)
 
     if df_all.empty:
         st.warning("paths.csv is empty.")
         st.stop()
 
+    if sampled:
+        st.caption(
+            "Showing the path sample: every near-critical path exactly, MET bulk as a "
+            "weighted sample per path group. Tick 'Load all paths' for all rows."
+        )
+
     # Filters (viewer-side)
     st.sidebar.header("Viewer Filters")
     groups = ["(all)"] + sorted(df_all["path_group"].dropna().unique().tolist())
@@ -92,7 +219,26 @@ def main():
         "Top K worst paths (viewer)", min_value=5, max_value=200, value=20, step=5
     )
 
-    df_view = compute_view(df_all, group=group, violations_only=violations_only)
+    st.sidebar.header("Pin Search")
+    search_field = st.sidebar.selectbox("Search in", ["endpoint", "startpoint"], index=0)
+    pattern = st.sidebar.text_input(
+        "Pin pattern", value="", help="Substring, or glob with * ? (e.g. */U_REG_*/D); [ is literal"
+    )
+    rows = None
+    if pattern.strip():
+        if backend == "outdir":
+            source = f"{outdir}|{'sampled' if sampled else 'full'}|{len(df_all)}"
+            index_path = None if sampled else str(Path(outdir) / "search_index.json")
+        else:
+            # the daemon may reload a report with the same row count: key on content
+            source = f"{server_url}|{names_key(df_all)}"
+            index_path = None
+        index = get_search_index(source, index_path, df_all)
+        rows = index.search(search_field, pattern.strip())
+
+    df_view = compute_view(
+        df_all, group=group, violations_only=violations_only, rows=rows
+    )
     overall = stats_from_df(df_all)
     view = stats_from_df(df_view)
 
@@ -117,9 +263,9 @@ def main():
     )
 
     st.download_button(
-        "Download paths.csv (all)",
+        "Download paths_sampled.csv" if sampled else "Download paths.csv (all)",
         data=df_all.to_csv(index=False).encode("utf-8"),
-        file_name="paths.csv",
+        file_name="paths_sampled.csv" if sampled else "paths.csv",
         mime="text/csv",
     )
 
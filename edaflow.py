@@ -2,12 +2,22 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+from analysis.external_sort import TopK, external_sort_to_file, parse_size
+from analysis.history import RunHistory, default_run_id
+from analysis.hotspots import HotspotCounter, find_hotspots
+from analysis.path_table import PATH_COLUMNS, filter_paths, hotspots_to_df
+from analysis.path_table import path_record as _path_record
+from analysis.path_table import paths_to_df as _paths_to_df
+from analysis.sampling import NEAR_CRITICAL_NS, SAMPLE_PER_GROUP, downsample_paths
+from analysis.search_index import PathSearchIndex, compile_matcher
+from analysis.summary_md import build_summary_md
 from datetime import datetime
 from parser.adapters.mock_sta import MockSTAAdapter
-from parser.timing_parser import load_report
-from parser.violation_summary import infer_violation_type, summarize
+from parser.timing_parser import iter_report_file, load_report
+from parser.violation_summary import SummaryAccumulator, infer_violation_type, summarize
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 
 import pandas as pd
 
@@ -24,185 +34,72 @@ def write_csv(df: pd.DataFrame, path: Path) -> None:
     df.to_csv(path, index=False)
 
 
-def _paths_to_df(paths) -> pd.DataFrame:
-    rows = []
-    for p in paths:
-        rows.append(
-            {
-                "startpoint": p.startpoint,
-                "endpoint": p.endpoint,
-                "path_group": p.path_group,
-                "path_type": p.path_type,
-                "slack": p.slack,
-                "slack_status": p.slack_status,
-                "notes": " ".join(p.notes),
-                "violation_type": infer_violation_type(p),
-            }
+def _view_filter(
+    group: Optional[str], violations_only: bool, endpoint: Optional[str]
+) -> Callable[..., bool]:
+    """Per-path form of filter_paths()'s filters; the endpoint matcher is built once."""
+    endpoint_match = compile_matcher(endpoint) if endpoint else None
+
+    def in_view(p) -> bool:
+        return (
+            (not group or p.path_group == group)
+            and (not violations_only or p.slack < 0)
+            and (endpoint_match is None or endpoint_match(p.endpoint))
         )
-    return pd.DataFrame(rows)
+
+    return in_view
 
 
-def filter_paths(
-    df: pd.DataFrame,
+def export_sorted_paths(
+    report_path: Path,
+    out_path: Path,
     group: Optional[str],
     violations_only: bool,
-) -> pd.DataFrame:
-    out = df.copy()
-
-    if group:
-        out = out[out["path_group"] == group]
-
-    if violations_only:
-        out = out[out["slack"] < 0]
-
-    # stable sort: worst slack first
-    out = out.sort_values(by=["slack"], ascending=True, kind="mergesort").reset_index(
-        drop=True
+    memory_budget: int,
+    fmt: str = "csv",
+    endpoint: Optional[str] = None,
+) -> Path:
+    """
+    Out-of-core counterpart of filter_paths(): streams the report, spills sorted
+    runs to disk once memory_budget is reached, and k-way merges them into one
+    slack-sorted file with the same (stable) order.
+    """
+    in_view = _view_filter(group, violations_only, endpoint)
+    records = (_path_record(p) for p in iter_report_file(str(report_path)) if in_view(p))
+    return external_sort_to_file(
+        records, PATH_COLUMNS, out_path, fmt=fmt, memory_budget=memory_budget
     )
-    return out
 
 
-def build_summary_md(
-    report_path: Path,
-    df_all: pd.DataFrame,
-    df_view: pd.DataFrame,
-    outdir: Path,
-    topk: int,
-) -> str:
-    # overall stats from ALL parsed paths (not filtered)
-    # (You can change this to filtered-only if you prefer)
-    # We'll display both overall and current view
-
-    # Rebuild TimingPath list for stats (small dataset; ok)
-    # If you want to avoid this, compute directly from df.
-    # We'll compute from df for simplicity:
-    def stats_from_df(df: pd.DataFrame) -> dict:
-        total = int(len(df))
-        violated = int((df["slack"] < 0).sum())
-        met = total - violated
-        wns = float(df["slack"].min()) if violated > 0 else 0.0
-        tns = float(df.loc[df["slack"] < 0, "slack"].sum()) if violated > 0 else 0.0
-        return {
-            "total_paths": total,
-            "violated_paths": violated,
-            "met_paths": met,
-            "wns": wns,
-            "tns": tns,
+def run_classifier(
+    paths, model_path: Path, outdir: Path, batch_size: int = 1024
+) -> Optional[Path]:
+    if not model_path.exists():
+        print(f"[WARN] classifier model not found, skipping: {model_path}")
+        return None
+
+    # scikit-learn is a dev dependency; only import it when the stage is enabled
+    from ml.violation_classifier import ViolationClassifier, predict_batches
+
+    clf = ViolationClassifier.load(model_path)
+    rows = [
+        {
+            "startpoint": p.startpoint,
+            "endpoint": p.endpoint,
+            "path_group": p.path_group,
+            "slack": p.slack,
+            "violation_type": infer_violation_type(p),
+            "predicted_type": pred,
         }
+        for p, pred in predict_batches(clf, paths, batch_size=batch_size)
+    ]
+    out_path = outdir / "predictions.csv"
+    write_csv(pd.DataFrame(rows), out_path)
+    return out_path
 
-    overall = stats_from_df(df_all)
-    view = stats_from_df(df_view)
-
-    # Group breakdown (ALL)
-    by_group = (
-        df_all.assign(is_viol=(df_all["slack"] < 0))
-        .groupby("path_group")
-        .agg(
-            total_paths=("slack", "size"),
-            violated_paths=("is_viol", "sum"),
-            wns=("slack", "min"),
-            tns=("slack", lambda s: float(s[s < 0].sum())),
-        )
-        .reset_index()
-        .sort_values(by=["wns"], ascending=True)
-    )
-
-    # Violation type counts (ALL)
-    vio_types = (
-        df_all[df_all["violation_type"] != "none"]
-        .groupby("violation_type")
-        .size()
-        .reset_index(name="count")
-        .sort_values("count", ascending=False)
-    )
-
-    # TopK table (VIEW)
-    top_df = df_view.head(topk).copy()
-    if len(top_df) == 0:
-        top_md = "_No paths match current filters._"
-    else:
-        top_df = top_df[
-            ["slack", "path_group", "violation_type", "startpoint", "endpoint", "notes"]
-        ]
-        # Keep markdown compact
-        top_md = top_df.to_markdown(index=False)
-
-    # Helpful artifact links (relative)
-    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    summary = f"""# Signoff Summary (edaflow-lite)
-
-- Report: `{report_path.name}`
-- Generated: `{now}`
-- Output directory: `{outdir.as_posix()}`
-
-## Overall (all parsed paths)
-
-- Total paths: **{overall["total_paths"]}**
-- Violated paths: **{overall["violated_paths"]}**
-- MET paths: **{overall["met_paths"]}**
-- WNS: **{overall["wns"]:.4f} ns**
-- TNS: **{overall["tns"]:.4f} ns**
-
-## Current View (after filters)
-
-- Total paths: **{view["total_paths"]}**
-- Violated paths: **{view["violated_paths"]}**
-- MET paths: **{view["met_paths"]}**
-- WNS: **{view["wns"]:.4f} ns**
-- TNS: **{view["tns"]:.4f} ns**
-
-## Breakdown by Path Group (all)
-
-{by_group.to_markdown(index=False)}
-
-## Violation Type Counts (all)
-
-{(vio_types.to_markdown(index=False) if len(vio_types) else "_No violation types inferred._")}
-
-## Top {topk} Worst Paths (current view)
-
-{top_md}
-
-## Artifacts
-
-- `paths.json`
-- `paths.csv`
-- `summary.json`
-- `top_violations.csv`
-- `slack_distribution.png`
-
-## Recommended Actions (triage)
-
-1. Start with **worst WNS** paths in `top_violations.csv` and confirm whether they are dominated by logic depth vs. clock uncertainty.
-2. If violations cluster in a single `path_group`, prioritize **group-level constraints** and **clock tree assumptions**.
-3. If inferred types show `transition` / `max_capacitance`, validate **slew/cap constraints** and fix high-fanout nets first.
-
-"""
-    return summary
-
-
-def main():
-    ap = argparse.ArgumentParser(description="edaflow-lite v0.2: mock EDA signoff flow")
-    ap.add_argument("--report", required=True, help="Path to timing report txt")
-    ap.add_argument("--outdir", default="out", help="Output directory")
-
-    # v0.2 CLI controls
-    ap.add_argument(
-        "--topk", type=int, default=20, help="Top K worst slack paths to export/report"
-    )
-    ap.add_argument(
-        "--violations-only", action="store_true", help="Only keep paths with slack < 0"
-    )
-    ap.add_argument(
-        "--group", type=str, default=None, help="Filter by a specific path group"
-    )
-
-    args = ap.parse_args()
-
-    report_path = Path(args.report)
-    outdir = Path(args.outdir)
-    outdir.mkdir(parents=True, exist_ok=True)
 
+def run_in_memory(args, report_path: Path, outdir: Path) -> Tuple[List[Path], dict]:
+    """Default pipeline: parse the whole report into df_all and write every artifact."""
     text = load_report(str(report_path))
 
     # Adapter layer (swap for real STA formats later)
@@ -219,46 +116,250 @@ def main():
     # 2) paths.csv
     write_csv(df_all, outdir / "paths.csv")
 
+    # 2b) paths_sampled.csv (all near-critical paths + weighted MET sample)
+    df_sampled = downsample_paths(
+        df_all, near_critical=args.near_critical, per_group=args.sample_per_group
+    )
+    write_csv(df_sampled, outdir / "paths_sampled.csv")
+
+    # 2c) search_index.json (startpoint/endpoint names -> paths.csv row ids)
+    search_index = PathSearchIndex.from_df(df_all)
+    search_index.save(outdir / "search_index.json")
+
     # 3) summary.json (all paths, not filtered)
     summary_obj = summarize(paths)
     write_json(summary_obj, outdir / "summary.json")
 
     # Apply filters for “view”
     df_view = filter_paths(
-        df_all, group=args.group, violations_only=args.violations_only
+        df_all,
+        group=args.group,
+        violations_only=args.violations_only,
+        endpoint=args.endpoint,
+        index=search_index,
     )
 
     # 4) top_violations.csv (topK of current view)
     top_df = df_view.head(args.topk).copy()
     write_csv(top_df, outdir / "top_violations.csv")
 
-    # 5) slack_distribution.png (all paths; change to df_view if you want filtered plot)
+    # 5) slack_distribution.png (all paths via the weighted sample; same shape, far fewer points)
     plot_slack_distribution(
-        df_all["slack"].tolist(),
+        df_sampled["slack"].tolist(),
         outdir / "slack_distribution.png",
+        weights=df_sampled["weight"].tolist(),
     )
 
-    # 6) summary.md (one-page report)
+    # 6) hotspots.csv (cells ranked by violating-path coverage)
+    hotspots_df = hotspots_to_df(find_hotspots(paths))
+    write_csv(hotspots_df, outdir / "hotspots.csv")
+
+    # 7) summary.md (one-page report)
     md = build_summary_md(
         report_path=report_path,
         df_all=df_all,
         df_view=df_view,
         outdir=outdir,
         topk=args.topk,
+        hotspots_df=hotspots_df,
     )
     (outdir / "summary.md").write_text(md, encoding="utf-8")
 
-    print("[OK] Generated artifacts:")
-    for p in [
+    artifacts = [
         outdir / "paths.json",
         outdir / "paths.csv",
+        outdir / "paths_sampled.csv",
+        outdir / "search_index.json",
         outdir / "summary.json",
         outdir / "top_violations.csv",
+        outdir / "hotspots.csv",
         outdir / "slack_distribution.png",
         outdir / "summary.md",
-    ]:
+    ]
+
+    # 8) predictions.csv (optional ML stage)
+    if args.classifier_model:
+        pred_path = run_classifier(
+            paths, Path(args.classifier_model), outdir, batch_size=args.batch_size
+        )
+        if pred_path is not None:
+            artifacts.append(pred_path)
+
+    return artifacts, summary_obj
+
+
+def run_streaming(args, report_path: Path, outdir: Path) -> Tuple[List[Path], dict]:
+    """
+    --memory-budget pipeline: a single streamed pass over the report that keeps
+    nothing proportional to its size in memory. The summary, hotspots and top-K
+    are accumulated while the filtered view is fed to the external sort.
+    Artifacts that need every path in memory are skipped.
+    """
+    summary = SummaryAccumulator()
+    hotspots = HotspotCounter()
+    top = TopK(args.topk)
+    in_view = _view_filter(args.group, args.violations_only, args.endpoint)
+
+    def view_records():
+        for p in iter_report_file(str(report_path)):
+            summary.add(p)
+            hotspots.add(p.slack, p.points)
+            if in_view(p):
+                rec = _path_record(p)
+                top.add(rec)
+                yield rec
+
+    # 1) paths_sorted.{csv,ndjson} (same rows/order as the filtered view);
+    #    the sort drains the stream, so the accumulators are complete afterwards
+    sorted_path = external_sort_to_file(
+        view_records(),
+        PATH_COLUMNS,
+        outdir / f"paths_sorted.{args.sorted_format}",
+        fmt=args.sorted_format,
+        memory_budget=args.memory_budget,
+    )
+
+    # 2) summary.json (all paths, not filtered)
+    summary_obj = summary.result()
+    write_json(summary_obj, outdir / "summary.json")
+
+    # 3) top_violations.csv (topK of current view)
+    write_csv(pd.DataFrame(top.items(), columns=PATH_COLUMNS), outdir / "top_violations.csv")
+
+    # 4) hotspots.csv (cells ranked by violating-path coverage)
+    write_csv(hotspots_to_df(hotspots.ranked()), outdir / "hotspots.csv")
+
+    print(
+        "[INFO] --memory-budget: streamed run, skipped paths.json, paths.csv, "
+        "paths_sampled.csv, search_index.json, slack_distribution.png and summary.md "
+        "(they need every path in memory; paths_sorted has the full filtered view)"
+    )
+    artifacts = [
+        sorted_path,
+        outdir / "summary.json",
+        outdir / "top_violations.csv",
+        outdir / "hotspots.csv",
+    ]
+    return artifacts, summary_obj
+
+
+def main(argv: Optional[list] = None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["serve"]:
+        # long-lived daemon: python edaflow.py serve --report ... [--port 8765]
+        from server.daemon import main as serve_main
+
+        return serve_main(argv[1:])
+
+    ap = argparse.ArgumentParser(description="edaflow-lite v0.2: mock EDA signoff flow")
+    ap.add_argument("--report", required=True, help="Path to timing report txt")
+    ap.add_argument("--outdir", default="out", help="Output directory")
+
+    # v0.2 CLI controls
+    ap.add_argument(
+        "--topk", type=int, default=20, help="Top K worst slack paths to export/report"
+    )
+    ap.add_argument(
+        "--violations-only", action="store_true", help="Only keep paths with slack < 0"
+    )
+    ap.add_argument(
+        "--group", type=str, default=None, help="Filter by a specific path group"
+    )
+    ap.add_argument(
+        "--endpoint",
+        type=str,
+        default=None,
+        help="Filter by endpoint pin: glob if it has * or ? (e.g. '*/U_REG_*/D'), else substring",
+    )
+    ap.add_argument(
+        "--memory-budget",
+        type=parse_size,
+        default=None,
+        help="Stream the report instead of loading it; writes a slack-sorted export via "
+        "spill-to-disk sort (e.g. 512M)",
+    )
+    ap.add_argument(
+        "--sorted-format",
+        choices=["csv", "ndjson"],
+        default="csv",
+        help="Format of the --memory-budget sorted export",
+    )
+    ap.add_argument(
+        "--near-critical",
+        type=float,
+        default=NEAR_CRITICAL_NS,
+        help="Slack (ns) below which paths are kept exactly in paths_sampled.csv",
+    )
+    ap.add_argument(
+        "--sample-per-group",
+        type=int,
+        default=SAMPLE_PER_GROUP,
+        help="MET paths sampled per path group in paths_sampled.csv",
+    )
+    ap.add_argument(
+        "--history",
+        type=str,
+        default=None,
+        help="Append this run's summary to a run-history DB (e.g. history/edaflow.db)",
+    )
+    ap.add_argument(
+        "--run-id", type=str, default=None, help="Run id for --history (default: timestamp)"
+    )
+    ap.add_argument(
+        "--corner", type=str, default="default", help="Corner label for --history"
+    )
+    ap.add_argument(
+        "--classifier-model",
+        type=str,
+        default=None,
+        help="Optional trained ml.violation_classifier model; writes predictions.csv",
+    )
+    ap.add_argument(
+        "--batch-size", type=int, default=1024, help="Batch size for classifier inference"
+    )
+
+    args = ap.parse_args(argv)
+
+    report_path = Path(args.report)
+    outdir = Path(args.outdir)
+
+    # fail before overwriting outdir if this (run id, corner) is already recorded
+    if args.history:
+        args.run_id = args.run_id or default_run_id(datetime.now())
+        with RunHistory(args.history) as history:
+            if history.has_run(args.run_id, args.corner):
+                ap.error(
+                    f"run {args.run_id!r} / corner {args.corner!r} already exists in "
+                    f"{args.history}; pick another --run-id or --corner"
+                )
+
+    outdir.mkdir(parents=True, exist_ok=True)
+
+    if args.memory_budget:
+        if args.classifier_model:
+            ap.error("--classifier-model needs the in-memory pipeline; drop --memory-budget")
+        artifacts, summary_obj = run_streaming(args, report_path, outdir)
+    else:
+        artifacts, summary_obj = run_in_memory(args, report_path, outdir)
+
+    print("[OK] Generated artifacts:")
+    for p in artifacts:
         print(f" - {p.resolve()}")
 
+    # Run history lives outside outdir so it survives the next run
+    if args.history:
+        with RunHistory(args.history) as history:
+            try:
+                run_id = history.append_run(
+                    summary_obj,
+                    report=report_path.name,
+                    run_id=args.run_id,
+                    corner=args.corner,
+                )
+            except ValueError as e:  # recorded by a concurrent run since the check above
+                ap.error(str(e))
+        print(f"[OK] Recorded run {run_id} ({args.corner}) in {Path(args.history).resolve()}")
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import math
+import pickle
+from parser.timing_parser import TimingPath, iter_report_file, pin_name
+from parser.violation_summary import infer_violation_type
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence, Tuple
+
+from sklearn.feature_extraction import FeatureHasher
+from sklearn.linear_model import SGDClassifier
+
+# partial_fit() needs every class up front; keep in sync with infer_violation_type()
+LABELS = ("none", "setup", "transition", "max_capacitance")
+
+N_FEATURES = 2**18
+SLACK_BIN_NS = 0.05
+SLACK_BIN_LIMIT = 20
+
+
+def _slack_bin(slack: float) -> int:
+    b = math.floor(slack / SLACK_BIN_NS)
+    return max(-SLACK_BIN_LIMIT, min(SLACK_BIN_LIMIT, b))
+
+
+def _hierarchy_tokens(prefix: str, name: str) -> List[str]:
+    parts = pin_name(name).split("/")
+    tokens = [f"{prefix}={'/'.join(parts[: i + 1])}" for i in range(len(parts))]
+    tokens.append(f"{prefix}_pin={parts[-1]}")
+    return tokens
+
+
+def path_tokens(path: TimingPath) -> List[str]:
+    """
+    String features for one path. These are hashed, so no vocabulary is kept:
+    - endpoint / startpoint hierarchy prefixes and the leaf pin name
+    - path group / type
+    - note words
+    - coarse slack bin
+    """
+    tokens = [
+        f"group={path.path_group}",
+        f"type={path.path_type}",
+        f"slack_bin={_slack_bin(path.slack)}",
+    ]
+    tokens += _hierarchy_tokens("ep", path.endpoint)
+    tokens += _hierarchy_tokens("sp", path.startpoint)
+    for note in path.notes:
+        tokens += [f"note={w}" for w in note.lower().split()]
+    return tokens
+
+
+def iter_path_batches(
+    report_files: Iterable[str | Path], batch_size: int = 1024
+) -> Iterator[List[TimingPath]]:
+    """Stream parsed paths from many reports in fixed-size batches."""
+    batch: List[TimingPath] = []
+    for report in report_files:
+        for p in iter_report_file(str(report)):
+            batch.append(p)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+class ViolationClassifier:
+    """
+    Hashed-feature linear classifier trained out-of-core with partial_fit().
+    Labels come from infer_violation_type() until real signoff labels exist.
+    """
+
+    def __init__(self, n_features: int = N_FEATURES):
+        self.hasher = FeatureHasher(
+            n_features=n_features, input_type="string", alternate_sign=False
+        )
+        self.model = SGDClassifier(loss="log_loss", random_state=0)
+        self.n_seen = 0
+
+    def featurize(self, paths: Sequence[TimingPath]):
+        return self.hasher.transform(path_tokens(p) for p in paths)
+
+    def partial_fit(self, paths: Sequence[TimingPath]) -> ViolationClassifier:
+        if not paths:
+            return self
+        y = [infer_violation_type(p) for p in paths]
+        self.model.partial_fit(self.featurize(paths), y, classes=list(LABELS))
+        self.n_seen += len(paths)
+        return self
+
+    def fit_reports(
+        self, report_files: Iterable[str | Path], batch_size: int = 1024
+    ) -> ViolationClassifier:
+        for batch in iter_path_batches(report_files, batch_size):
+            self.partial_fit(batch)
+        return self
+
+    def predict(self, paths: Sequence[TimingPath]) -> List[str]:
+        if not paths:
+            return []
+        return [str(label) for label in self.model.predict(self.featurize(paths))]
+
+    def save(self, path: str | Path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            pickle.dump(self, f)
+        return path
+
+    @classmethod
+    def load(cls, path: str | Path) -> ViolationClassifier:
+        with open(path, "rb") as f:
+            obj = pickle.load(f)
+        if not isinstance(obj, cls):
+            raise TypeError(f"{path} does not contain a {cls.__name__}")
+        return obj
+
+
+def train_incremental(
+    report_files: Iterable[str | Path],
+    model_path: str | Path,
+    batch_size: int = 1024,
+) -> ViolationClassifier:
+    """Resume from the cached model (if any), train on more reports, save it back."""
+    model_path = Path(model_path)
+    clf = ViolationClassifier.load(model_path) if model_path.exists() else ViolationClassifier()
+    clf.fit_reports(report_files, batch_size=batch_size)
+    clf.save(model_path)
+    return clf
+
+
+def predict_batches(
+    clf: ViolationClassifier, paths: Iterable[TimingPath], batch_size: int = 1024
+) -> Iterator[Tuple[TimingPath, str]]:
+    batch: List[TimingPath] = []
+    for p in paths:
+        batch.append(p)
+        if len(batch) >= batch_size:
+            yield from zip(batch, clf.predict(batch))
+            batch = []
+    if batch:
+        yield from zip(batch, clf.predict(batch))
+
+
+def main():
+    import argparse
+
+    # import by module path so pickles reference ml.violation_classifier, not __main__
+    from ml.violation_classifier import train_incremental
+
+    ap = argparse.ArgumentParser(description="Incrementally train the violation classifier")
+    ap.add_argument("--reports", nargs="+", required=True, help="Timing report txt files")
+    ap.add_argument("--model", default="out/violation_classifier.pkl", help="Model cache path")
+    ap.add_argument("--batch-size", type=int, default=1024)
+    args = ap.parse_args()
+
+    clf = train_incremental(args.reports, args.model, batch_size=args.batch_size)
+    print(f"[OK] trained on {clf.n_seen} paths total -> {Path(args.model).resolve()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import re
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, List, Pattern
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Pattern
 
 
 @dataclass
@@ -14,6 +15,10 @@ class TimingPath:
     slack: float
     slack_status: str  # MET / VIOLATED
     notes: List[str]
+    # pins from the point table, in path order (e.g. "U_TOP/U_COMB1/Z");
+    # only kept for violating paths, the only ones hotspot analysis reads.
+    # Interned, so a pin shared by many paths is stored once.
+    points: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
@@ -36,6 +41,19 @@ _SLACK_RE = re.compile(
 
 _NOTE_RE = re.compile(r"^note:\s*(.+)$", re.MULTILINE)
 
+# point table row examples (pin, incr, path):
+#   U_TOP/U_COMB1/Z                          0.22     0.49
+# rows without a hierarchical pin ("clock network delay", ...) are skipped
+_POINT_RE = re.compile(
+    r"^\s*(\S+/\S+)\s+[-+]?\d+(?:\.\d+)?\s+[-+]?\d+(?:\.\d+)?\s*$",
+    re.MULTILINE,
+)
+
+
+def pin_name(name: str) -> str:
+    # "U_TOP/U_REG_A/Q (rising edge-triggered flip-flop)" -> "U_TOP/U_REG_A/Q"
+    return name.split(" (", 1)[0].strip()
+
 
 def _extract_one(
     pattern: Pattern[str], text: str, default: str | None = None
@@ -46,6 +64,44 @@ def _extract_one(
     return default
 
 
+def _split_blocks(text: str) -> List[str]:
+    return [b.strip() for b in _BLOCK_SPLIT_RE.split(text) if b.strip()]
+
+
+def _parse_block(block: str) -> Optional[TimingPath]:
+    startpoint = _extract_one(_START_RE, block)
+    endpoint = _extract_one(_END_RE, block)
+    path_group = _extract_one(_GROUP_RE, block, default="UNKNOWN") or "UNKNOWN"
+    path_type = _extract_one(_TYPE_RE, block, default="UNKNOWN") or "UNKNOWN"
+
+    slack_m = _SLACK_RE.search(block)
+    if not slack_m:
+        # no slack -> ignore this block
+        return None
+    slack_status = slack_m.group(1).strip()
+    slack = float(slack_m.group(2))
+
+    notes = [n.strip() for n in _NOTE_RE.findall(block)]
+    # MET paths are the bulk of a report; don't hold paths x stages pin strings for them
+    points = [sys.intern(p) for p in _POINT_RE.findall(block)] if slack < 0 else []
+
+    if not startpoint or not endpoint:
+        # still allow if slack exists, but keep placeholders
+        startpoint = startpoint or "UNKNOWN_START"
+        endpoint = endpoint or "UNKNOWN_END"
+
+    return TimingPath(
+        startpoint=startpoint,
+        endpoint=endpoint,
+        path_group=path_group,
+        path_type=path_type,
+        slack=slack,
+        slack_status=slack_status,
+        notes=notes,
+        points=points,
+    )
+
+
 def parse_timing_report(report_text: str) -> List[TimingPath]:
     """
     Parse a simplified STA timing report into structured TimingPath objects.
@@ -54,44 +110,48 @@ def parse_timing_report(report_text: str) -> List[TimingPath]:
     - If a block is missing key fields, we skip it (rather than crashing).
     - Slack is required; otherwise the block is not useful for signoff summary.
     """
-    blocks = [b.strip() for b in _BLOCK_SPLIT_RE.split(report_text) if b.strip()]
+    blocks = _split_blocks(report_text)
     paths: List[TimingPath] = []
     print(f"DEBUG: total raw blocks = {len(blocks)}")
     for block in blocks:
-        startpoint = _extract_one(_START_RE, block)
-        endpoint = _extract_one(_END_RE, block)
-        path_group = _extract_one(_GROUP_RE, block, default="UNKNOWN") or "UNKNOWN"
-        path_type = _extract_one(_TYPE_RE, block, default="UNKNOWN") or "UNKNOWN"
-
-        slack_m = _SLACK_RE.search(block)
-        if not slack_m:
-            # no slack -> ignore this block
-            continue
-        slack_status = slack_m.group(1).strip()
-        slack = float(slack_m.group(2))
-
-        notes = [n.strip() for n in _NOTE_RE.findall(block)]
-
-        if not startpoint or not endpoint:
-            # still allow if slack exists, but keep placeholders
-            startpoint = startpoint or "UNKNOWN_START"
-            endpoint = endpoint or "UNKNOWN_END"
-
-        paths.append(
-            TimingPath(
-                startpoint=startpoint,
-                endpoint=endpoint,
-                path_group=path_group,
-                path_type=path_type,
-                slack=slack,
-                slack_status=slack_status,
-                notes=notes,
-            )
-        )
+        p = _parse_block(block)
+        if p is not None:
+            paths.append(p)
 
     return paths
 
 
+def iter_report_blocks(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield path blocks from report lines without holding the whole report.
+
+    Lines must keep their line endings (e.g. a file object). Blocks are
+    identical to the ones parse_timing_report() splits out of the full text.
+    """
+    buf: List[str] = []
+    for line in lines:
+        buf.append(line)
+        if line.endswith("=\n"):
+            # the separator always ends a line, so it never spans two chunks
+            yield from _split_blocks("".join(buf))
+            buf.clear()
+    if buf:
+        yield from _split_blocks("".join(buf))
+
+
+def iter_timing_paths(lines: Iterable[str]) -> Iterator[TimingPath]:
+    """Streaming counterpart of parse_timing_report()."""
+    for block in iter_report_blocks(lines):
+        p = _parse_block(block)
+        if p is not None:
+            yield p
+
+
+def iter_report_file(path: str) -> Iterator[TimingPath]:
+    with open(path, "r", encoding="utf-8") as f:
+        yield from iter_timing_paths(f)
+
+
 def load_report(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
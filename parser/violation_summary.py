@@ -81,6 +81,49 @@ def summarize(paths: List[TimingPath]) -> Dict:
     }
 
 
+def _empty_stats() -> ViolationStats:
+    return ViolationStats(total_paths=0, violated_paths=0, met_paths=0, wns=0.0, tns=0.0)
+
+
+def _add_slack(st: ViolationStats, slack: float) -> None:
+    st.total_paths += 1
+    if slack < 0:
+        st.violated_paths += 1
+        st.wns = min(st.wns, slack)
+        st.tns += slack
+    else:
+        st.met_paths += 1
+
+
+class SummaryAccumulator:
+    """
+    Single-pass counterpart of summarize() for streamed paths.
+    result() returns the same structure (and the same numbers) as summarize().
+    """
+
+    def __init__(self) -> None:
+        self.overall = _empty_stats()
+        self.by_group: Dict[str, ViolationStats] = {}
+        self.vio_types: Dict[str, int] = defaultdict(int)
+
+    def add(self, path: TimingPath) -> None:
+        group = self.by_group.get(path.path_group)
+        if group is None:
+            group = self.by_group[path.path_group] = _empty_stats()
+        for st in (self.overall, group):
+            _add_slack(st, path.slack)
+        vt = infer_violation_type(path)
+        if vt != "none":
+            self.vio_types[vt] += 1
+
+    def result(self) -> Dict:
+        return {
+            "overall": dict(self.overall.__dict__),
+            "by_path_group": {g: dict(st.__dict__) for g, st in self.by_group.items()},
+            "violation_types": dict(self.vio_types),
+        }
+
+
 if __name__ == "__main__":
     import argparse
     import json
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+import pandas as pd
+
+
+def fetch_json(base_url: str, route: str, timeout: float = 30.0, **params: Any) -> Any:
+    """GET a route from a running `edaflow.py serve` and decode the JSON body."""
+    query = {k: v for k, v in params.items() if v is not None}
+    url = base_url.rstrip("/") + route + (f"?{urlencode(query)}" if query else "")
+    try:
+        with urlopen(url, timeout=timeout) as resp:
+            return json.loads(resp.read().decode("utf-8"))
+    except HTTPError as e:
+        detail = json.loads(e.read().decode("utf-8")).get("error", e.reason)
+        raise RuntimeError(f"edaflow serve: {detail} ({url})") from e
+    except URLError as e:
+        raise ConnectionError(
+            f"Cannot reach edaflow serve at {base_url}: {e.reason}. "
+            "Start it with: python edaflow.py serve --report reports/timing_report.txt"
+        ) from e
+
+
+def load_artifacts_from_server(
+    base_url: str, report: Optional[str] = None, full: bool = False
+) -> dict:
+    """
+    Same shape as app.load_artifacts(), served from the warm in-memory index.
+    Like paths_sampled.csv, the default is the daemon's tail-preserving sample;
+    full=True pulls every row.
+    """
+    res = fetch_json(base_url, "/paths", report=report, sampled=None if full else 1)
+    df_all = pd.DataFrame(res["rows"])
+    top = fetch_json(base_url, "/topk", report=report, violations_only=1)
+    md = fetch_json(base_url, "/summary.md", report=report)["markdown"]
+    return {
+        "df_all": df_all,
+        "df_top": pd.DataFrame(top["rows"]),
+        "md": md,
+        "png_path": None,
+        "sampled": not full,
+    }
+
+
+def server_reports(base_url: str) -> Dict[str, Any]:
+    reports: Dict[str, Any] = fetch_json(base_url, "/reports")
+    return reports
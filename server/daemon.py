@@ -0,0 +1,403 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from analysis.hotspots import find_hotspots
+from analysis.path_table import filter_paths, hotspots_to_df, paths_to_df
+from analysis.sampling import downsample_paths
+from analysis.summary_md import build_summary_md
+from datetime import datetime
+from parser.adapters.mock_sta import MockSTAAdapter
+from parser.timing_parser import TimingPath, load_report
+from parser.violation_summary import summarize
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+import pandas as pd
+
+_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class RawJSON(str):
+    """A response body that is already JSON-encoded; sent as is."""
+
+
+def _encode_rows(df: pd.DataFrame) -> List[str]:
+    return [json.dumps(r) for r in df.to_dict(orient="records")]
+
+
+@dataclass(frozen=True)
+class _Snapshot:
+    """Everything derived from one parse of a report. Replaced, never mutated."""
+
+    paths: List[TimingPath]
+    df_sorted: pd.DataFrame  # worst slack first, stable; "path_id" = parse order
+    by_group: Dict[str, pd.DataFrame]  # same order, one frame per path_group
+    row_json: List[str]  # JSON of each df_sorted row, indexed by path_id
+    sampled_json: List[str]  # downsample_paths() of df_sorted (+ "weight"), worst first
+    summary: Dict[str, Any]
+    summary_md: str
+    loaded_at: str
+
+
+class ReportIndex:
+    """
+    Warm in-memory index of one timing report.
+
+    The report is parsed once; refresh() re-parses only when the file's
+    mtime/size changes. Readers always see a complete snapshot.
+    """
+
+    def __init__(self, report_path: str | Path):
+        self.report_path = Path(report_path)
+        self.name = self.report_path.name
+        self._sig: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self.snapshot = self._build()
+
+    def _signature(self) -> Tuple[int, int]:
+        st = os.stat(self.report_path)
+        return (st.st_mtime_ns, st.st_size)
+
+    def _build(self) -> _Snapshot:
+        sig = self._signature()
+        paths = MockSTAAdapter().parse(load_report(str(self.report_path)))
+        df_all = paths_to_df(paths)
+        df_all.insert(0, "path_id", range(len(df_all)))
+        by_group: Dict[str, pd.DataFrame] = {}
+        summary_md = ""
+        if len(df_all):
+            df_sorted = filter_paths(df_all, group=None, violations_only=False)
+            for g in df_sorted["path_group"].unique():
+                by_group[str(g)] = filter_paths(df_sorted, group=str(g), violations_only=False)
+            hotspots_df = hotspots_to_df(find_hotspots(paths))
+            # nothing is written to disk, so the markdown lists no artifacts
+            summary_md = build_summary_md(
+                report_path=self.report_path,
+                df_all=df_all,
+                df_view=df_sorted,
+                outdir=None,
+                topk=20,
+                hotspots_df=hotspots_df,
+                artifacts=(),
+            )
+        else:
+            # no paths (e.g. a truncated mid-rewrite report): still PATH_COLUMNS + path_id
+            df_sorted = df_all
+        # encode rows once per snapshot: to_dict()/json.dumps are pure Python and hold
+        # the GIL, so doing them per request would serialize every worker thread
+        row_json = _encode_rows(df_all)
+        self._sig = sig
+        return _Snapshot(
+            paths=paths,
+            df_sorted=df_sorted,
+            by_group=by_group,
+            row_json=row_json,
+            sampled_json=_encode_rows(downsample_paths(df_sorted)),
+            summary=summarize(paths),
+            summary_md=summary_md,
+            loaded_at=datetime.now().isoformat(timespec="seconds"),
+        )
+
+    def refresh(self) -> bool:
+        """Re-parse if the report changed on disk. Returns True if reloaded."""
+        with self._lock:
+            if self._signature() == self._sig:
+                return False
+            self.snapshot = self._build()
+            return True
+
+    # ---- queries (CPU-bound; run in the worker pool) ----
+
+    def view(self, group: Optional[str], violations_only: bool) -> pd.DataFrame:
+        snap = self.snapshot
+        if group:
+            df = snap.by_group.get(group)
+            if df is None:
+                return snap.df_sorted.iloc[0:0]
+        else:
+            df = snap.df_sorted
+        if violations_only:
+            # frames are sorted by slack, so violations are a prefix
+            df = df.iloc[: int(df["slack"].searchsorted(0.0, side="left"))]
+        return df
+
+    def query_paths_json(
+        self,
+        group: Optional[str],
+        violations_only: bool,
+        offset: int,
+        limit: Optional[int],
+        sampled: bool = False,
+    ) -> RawJSON:
+        """Body of /paths and /topk, spliced from the pre-encoded rows."""
+        end = None if limit is None else offset + limit
+        snap = self.snapshot
+        if sampled:
+            if group or violations_only:
+                raise HTTPError(400, "sampled cannot be combined with group/violations_only")
+            total = len(snap.sampled_json)
+            rows = snap.sampled_json[offset:end]
+        else:
+            df = self.view(group, violations_only)
+            total = len(df)
+            rows = [snap.row_json[i] for i in df["path_id"].to_numpy()[offset:end].tolist()]
+        return RawJSON(f'{{"total": {total}, "offset": {offset}, "rows": [{", ".join(rows)}]}}')
+
+    def query_paths(
+        self,
+        group: Optional[str],
+        violations_only: bool,
+        offset: int,
+        limit: Optional[int],
+        sampled: bool = False,
+    ) -> Dict[str, Any]:
+        body: Dict[str, Any] = json.loads(
+            self.query_paths_json(group, violations_only, offset, limit, sampled)
+        )
+        return body
+
+    def stats(self, group: Optional[str], violations_only: bool) -> Dict[str, Any]:
+        df = self.view(group, violations_only)
+        neg = df.loc[df["slack"] < 0, "slack"]
+        return {
+            "total_paths": int(len(df)),
+            "violated_paths": int(len(neg)),
+            "met_paths": int(len(df) - len(neg)),
+            "wns": float(neg.min()) if len(neg) else 0.0,
+            "tns": float(neg.sum()) if len(neg) else 0.0,
+        }
+
+    def path_detail(self, path_id: int) -> Dict[str, Any]:
+        paths = self.snapshot.paths
+        if not 0 <= path_id < len(paths):
+            raise HTTPError(404, f"no path {path_id} in {self.name}")
+        return {"path_id": path_id, **paths[path_id].to_dict()}
+
+
+def _get_int(qs: Dict[str, List[str]], key: str, default: Optional[int]) -> Optional[int]:
+    if key not in qs:
+        return default
+    try:
+        value = int(qs[key][0])
+    except ValueError:
+        raise HTTPError(400, f"{key} must be an integer") from None
+    if value < 0:
+        raise HTTPError(400, f"{key} must be >= 0")
+    return value
+
+
+def _get_bool(qs: Dict[str, List[str]], key: str) -> bool:
+    return qs.get(key, ["0"])[0].lower() in ("1", "true", "yes")
+
+
+class EdaflowServer:
+    """
+    Local HTTP/JSON API over warm ReportIndex objects.
+
+    Routes (GET):
+      /health
+      /reports
+      /summary?report=
+      /summary.md?report=
+      /stats?report=&group=&violations_only=
+      /paths?report=&group=&violations_only=&offset=&limit=&sampled=
+      /topk?report=&group=&violations_only=&k=
+      /paths/<path_id>?report=
+    """
+
+    def __init__(
+        self,
+        report_paths: List[str | Path],
+        workers: int = 4,
+        poll_interval: float = 2.0,
+    ):
+        if not report_paths:
+            raise ValueError("at least one report is required")
+        # reports are addressed by file name (?report=), so names must be unique
+        seen: Dict[str, Path] = {}
+        for rp in map(Path, report_paths):
+            if rp.name in seen:
+                raise ValueError(
+                    f"duplicate report name {rp.name!r}: {seen[rp.name]} and {rp}; "
+                    "rename or copy one of them"
+                )
+            seen[rp.name] = rp
+        self.indexes: Dict[str, ReportIndex] = {}
+        for rp in seen.values():
+            idx = ReportIndex(rp)
+            self.indexes[idx.name] = idx
+        self.default_report = next(iter(self.indexes))
+        # threads keep the event loop responsive while a query runs; they share the GIL,
+        # so rows are pre-encoded per snapshot and a query is only a slice and a join
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="edaflow")
+        self.poll_interval = poll_interval
+        self._watcher: Optional[asyncio.Task] = None
+
+    def _index(self, qs: Dict[str, List[str]]) -> ReportIndex:
+        name = qs.get("report", [self.default_report])[0]
+        idx = self.indexes.get(name)
+        if idx is None:
+            raise HTTPError(404, f"unknown report {name!r}")
+        return idx
+
+    async def _offload(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, fn, *args)
+
+    async def dispatch(self, method: str, target: str) -> Tuple[int, Any]:
+        if method != "GET":
+            raise HTTPError(405, f"{method} not supported")
+        url = urlsplit(target)
+        route = url.path.rstrip("/") or "/"
+        qs = parse_qs(url.query)
+
+        if route == "/health":
+            return 200, {"status": "ok"}
+        if route == "/reports":
+            return 200, {
+                name: {"loaded_at": idx.snapshot.loaded_at, "paths": len(idx.snapshot.paths)}
+                for name, idx in self.indexes.items()
+            }
+
+        idx = self._index(qs)
+        group = qs.get("group", [None])[0]
+        violations_only = _get_bool(qs, "violations_only")
+
+        if route == "/summary":
+            snap = idx.snapshot
+            return 200, {"report": idx.name, "loaded_at": snap.loaded_at, **snap.summary}
+        if route == "/summary.md":
+            return 200, {"report": idx.name, "markdown": idx.snapshot.summary_md}
+        if route == "/stats":
+            return 200, await self._offload(idx.stats, group, violations_only)
+        if route == "/paths":
+            offset = _get_int(qs, "offset", 0) or 0
+            limit = _get_int(qs, "limit", None)
+            sampled = _get_bool(qs, "sampled")
+            return 200, await self._offload(
+                idx.query_paths_json, group, violations_only, offset, limit, sampled
+            )
+        if route == "/topk":
+            k = _get_int(qs, "k", 20)
+            return 200, await self._offload(idx.query_paths_json, group, violations_only, 0, k)
+        if route.startswith("/paths/"):
+            try:
+                path_id = int(route.rsplit("/", 1)[1])
+            except ValueError:
+                raise HTTPError(400, "path id must be an integer") from None
+            return 200, await self._offload(idx.path_detail, path_id)
+
+        raise HTTPError(404, f"unknown route {route}")
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = (await reader.readline()).decode("latin-1")
+            # headers are not needed for GET-only routes; just drain them
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            parts = request_line.split()
+            if len(parts) < 2:
+                raise HTTPError(400, "malformed request line")
+            status, body = await self.dispatch(parts[0], parts[1])
+        except HTTPError as e:
+            status, body = e.status, {"error": str(e)}
+        except Exception as e:  # keep the daemon alive on unexpected failures
+            status, body = 500, {"error": f"{type(e).__name__}: {e}"}
+
+        text = body if isinstance(body, RawJSON) else json.dumps(body)
+        payload = text.encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        writer.write(head.encode("latin-1") + payload)
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def refresh_all(self) -> None:
+        """Re-parse changed reports; a failed reload keeps the last snapshot."""
+        for idx in self.indexes.values():
+            try:
+                if await self._offload(idx.refresh):
+                    print(f"[OK] reloaded {idx.report_path}")
+            except Exception as e:  # e.g. half-written file; retried on the next poll
+                print(f"[WARN] cannot refresh {idx.report_path}: {type(e).__name__}: {e}")
+
+    async def _watch(self) -> None:
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            await self.refresh_all()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.Server:
+        server = await asyncio.start_server(self._handle, host, port)
+        self._watcher = asyncio.create_task(self._watch())
+        return server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        server = await self.start(host, port)
+        addr = server.sockets[0].getsockname()
+        print(f"[OK] edaflow serve listening on http://{addr[0]}:{addr[1]}")
+        for name in self.indexes:
+            print(f" - {name}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self._watcher is not None:
+                self._watcher.cancel()
+            self.pool.shutdown(wait=False)
+
+
+def main(argv: Optional[List[str]] = None):
+    import argparse
+
+    ap = argparse.ArgumentParser(
+        prog="edaflow.py serve", description="Serve parsed timing reports over HTTP/JSON"
+    )
+    ap.add_argument(
+        "--report", action="append", required=True, help="Timing report txt (repeatable)"
+    )
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--workers", type=int, default=4, help="Worker threads for heavy queries")
+    ap.add_argument(
+        "--poll-interval", type=float, default=2.0, help="Seconds between report change checks"
+    )
+    args = ap.parse_args(argv)
+
+    try:
+        server = EdaflowServer(
+            args.report, workers=args.workers, poll_interval=args.poll_interval
+        )
+    except ValueError as e:
+        ap.error(str(e))
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import io
+import json
+import random
+from parser.timing_parser import parse_timing_report
+from parser.violation_summary import summarize
+
+import pandas as pd
+import pytest
+
+import edaflow
+from analysis.external_sort import (
+    ExternalSorter,
+    TopK,
+    external_sort_to_file,
+    merge_plan,
+    parse_size,
+    write_csv_stream,
+)
+from analysis.hotspots import find_hotspots
+from edaflow import _paths_to_df, export_sorted_paths, filter_paths
+
+
+def _records(n=500):
+    rng = random.Random(0)
+    # few distinct slacks -> many ties, so stability matters
+    return [
+        {
+            "name": f"p{i}",
+            "group": rng.choice(["a", "b"]),
+            "slack": rng.choice([-0.2, -0.1, 0.0, 0.3]),
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.mark.parametrize("budget,fan_in", [(1 << 30, 64), (4096, 64), (2048, 3)])
+def test_external_sort_matches_stable_mergesort(tmp_path, budget, fan_in):
+    records = _records()
+    sorter = ExternalSorter(
+        ["name", "group", "slack"], memory_budget=budget, tmpdir=tmp_path, max_fan_in=fan_in
+    )
+    got = [r["name"] for r in sorter.sort(records)]
+
+    expected = (
+        pd.DataFrame(records).sort_values(by=["slack"], kind="mergesort")["name"].tolist()
+    )
+    assert got == expected
+    if budget < 1 << 20:
+        assert sorter.n_runs > 1
+    # temp runs are cleaned up
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize("budget", [1 << 10, 8 << 10, 256 << 10, 1 << 30])
+def test_merge_buffers_follow_budget(budget):
+    fan_in, io_buffer = merge_plan(budget)
+    assert 2 <= fan_in <= 64
+    # inputs + output buffered within the budget (or the 3-file minimum)
+    assert (fan_in + 1) * io_buffer <= max(budget, 3 << 10)
+    assert merge_plan(1 << 30) == (64, 1 << 16)
+
+
+def test_sorted_csv_equals_in_memory_export(tmp_path):
+    report = tmp_path / "r.txt"
+    report.write_text(open("reports/timing_report.txt", encoding="utf-8").read() * 50)
+
+    out = export_sorted_paths(
+        report,
+        tmp_path / "paths_sorted.csv",
+        group=None,
+        violations_only=False,
+        memory_budget=8192,
+    )
+    df = _paths_to_df(parse_timing_report(report.read_text(encoding="utf-8")))
+    expected = filter_paths(df, group=None, violations_only=False).to_csv(index=False)
+    assert out.read_text(encoding="utf-8") == expected
+
+
+def test_endpoint_glob_compiled_once_per_export(tmp_path, monkeypatch):
+    import analysis.search_index as search_index
+
+    calls = []
+    real = search_index.glob_regex
+    monkeypatch.setattr(search_index, "glob_regex", lambda p: calls.append(p) or real(p))
+
+    report = tmp_path / "r.txt"
+    report.write_text(open("reports/timing_report.txt", encoding="utf-8").read() * 20)
+    out = export_sorted_paths(
+        report, tmp_path / "s.csv", None, False, memory_budget=8192, endpoint="*/U_REG_*/D"
+    )
+    assert calls == ["*/U_REG_*/D"]
+    assert len(out.read_text(encoding="utf-8").splitlines()) > 1
+
+
+def test_budgeted_run_never_builds_df_all(tmp_path, monkeypatch):
+    report = tmp_path / "r.txt"
+    report.write_text(open("reports/timing_report.txt", encoding="utf-8").read() * 50)
+
+    def in_memory(*args, **kwargs):
+        raise AssertionError("--memory-budget run used the in-memory pipeline")
+
+    for name in ("load_report", "_paths_to_df", "summarize", "find_hotspots"):
+        monkeypatch.setattr(edaflow, name, in_memory)
+    monkeypatch.setattr(edaflow.MockSTAAdapter, "parse", in_memory)
+
+    outdir = tmp_path / "out"
+    argv = ["--report", str(report), "--outdir", str(outdir), "--topk", "7"]
+    edaflow.main(argv + ["--group", "clk_core", "--memory-budget", "8K"])
+    monkeypatch.undo()
+
+    assert not (outdir / "paths.csv").exists()
+    paths = parse_timing_report(report.read_text(encoding="utf-8"))
+    view = filter_paths(_paths_to_df(paths), group="clk_core", violations_only=False)
+    assert 7 < len(view) < len(paths)
+    assert (outdir / "paths_sorted.csv").read_text(encoding="utf-8") == view.to_csv(index=False)
+    assert (outdir / "top_violations.csv").read_text(encoding="utf-8") == view.head(7).to_csv(
+        index=False
+    )
+    assert json.loads((outdir / "summary.json").read_text()) == summarize(paths)
+    hot = pd.read_csv(outdir / "hotspots.csv")
+    assert hot["cell"].tolist() == [h.cell for h in find_hotspots(paths)]
+
+
+def test_topk_keeps_stable_order():
+    records = _records()
+    top = TopK(25)
+    for r in records:
+        top.add(r)
+    expected = pd.DataFrame(records).sort_values(by=["slack"], kind="mergesort").head(25)
+    assert [r["name"] for r in top.items()] == expected["name"].tolist()
+    assert TopK(0).items() == []
+
+
+def test_ndjson_and_csv_streams(tmp_path):
+    records = [{"a": "x,y", "slack": 0.5}, {"a": "z", "slack": -1.0}]
+    out = external_sort_to_file(records, ["a", "slack"], tmp_path / "o.ndjson", fmt="ndjson")
+    lines = [json.loads(x) for x in out.read_text(encoding="utf-8").splitlines()]
+    assert lines == [{"a": "z", "slack": -1.0}, {"a": "x,y", "slack": 0.5}]
+
+    buf = io.StringIO()
+    write_csv_stream(records, ["a", "slack"], buf)
+    assert buf.getvalue() == 'a,slack\n"x,y",0.5\nz,-1.0\n'
+
+
+def test_parse_size():
+    assert parse_size("512M") == 512 << 20
+    assert parse_size("1.5k") == 1536
+    assert parse_size("2GB") == 2 << 30
+    assert parse_size("100") == 100
+    with pytest.raises(ValueError):
+        parse_size("lots")
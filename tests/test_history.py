@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta
+from parser.timing_parser import TimingPath
+from parser.violation_summary import summarize
+
+import pytest
+
+import edaflow
+from analysis.history import RunHistory
+
+
+def _summary(slack: float):
+    return summarize(
+        [
+            TimingPath("A", "B", "g1", "max", slack, "VIOLATED", []),
+            TimingPath("C", "D", "g2", "max", 0.2, "MET", []),
+        ]
+    )
+
+
+def test_append_and_trend_queries(tmp_path):
+    db = tmp_path / "hist.db"
+    t0 = datetime(2026, 1, 1, 2, 0, 0)
+    with RunHistory(db) as h:
+        for i in range(5):
+            ts = t0 + timedelta(days=i)
+            h.append_run(_summary(-0.1 * (i + 1)), "r.txt", run_id=f"n{i}", ts=ts)
+            h.append_run(_summary(-0.05), "r.txt", run_id=f"n{i}", corner="ss", ts=ts)
+
+    # reopen: data is persisted
+    with RunHistory(db) as h:
+        assert h.num_runs() == 5
+        assert h.corners() == ["default", "ss"]
+        assert h.path_groups() == ["g1", "g2"]
+
+        trend = h.run_trend(limit=3)
+        assert [r["run_id"] for r in trend] == ["n2", "n3", "n4"]
+        assert trend[-1]["corners"] == 2
+        assert trend[-1]["violated_paths"] == 2
+        assert trend[-1]["wns"] == pytest.approx(-0.5)
+        assert trend[-1]["tns"] == pytest.approx(-0.55)
+
+        ss = h.run_trend(corner="ss")
+        assert len(ss) == 5
+        assert all(r["wns"] == pytest.approx(-0.05) for r in ss)
+
+        g1 = h.group_trend("g1", corner="default")
+        assert [r["wns"] for r in g1] == pytest.approx([-0.1, -0.2, -0.3, -0.4, -0.5])
+
+        # without a corner, limit counts runs and rows are aggregated over both corners
+        g1_all = h.group_trend("g1", limit=2)
+        assert [r["run_id"] for r in g1_all] == ["n3", "n4"]
+        assert [r["corners"] for r in g1_all] == [2, 2]
+        assert g1_all[-1]["violated_paths"] == 2
+        assert g1_all[-1]["wns"] == pytest.approx(-0.5)
+        assert g1_all[-1]["tns"] == pytest.approx(-0.55)
+
+
+def test_duplicate_run_rejected(tmp_path):
+    with RunHistory(tmp_path / "hist.db") as h:
+        h.append_run(_summary(-0.1), "r.txt", run_id="n0")
+        with pytest.raises(ValueError):
+            h.append_run(_summary(-0.1), "r.txt", run_id="n0")
+        assert h.has_run("n0") and not h.has_run("n0", corner="ss")
+
+
+def test_cli_rejects_recorded_run_before_writing(tmp_path, capsys):
+    db = tmp_path / "hist.db"
+    with RunHistory(db) as h:
+        h.append_run(_summary(-0.1), "r.txt", run_id="n0", corner="tt")
+
+    outdir = tmp_path / "out"
+    argv = ["--report", "reports/timing_report.txt", "--outdir", str(outdir)]
+    with pytest.raises(SystemExit):
+        edaflow.main(argv + ["--history", str(db), "--run-id", "n0", "--corner", "tt"])
+    assert "already exists" in capsys.readouterr().err
+    assert not outdir.exists()
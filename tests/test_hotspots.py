@@ -0,0 +1,78 @@
+from parser.timing_parser import parse_timing_report
+
+from analysis.hotspots import HotspotCounter, cell_of_pin, find_hotspots
+
+REPORT = """
+Startpoint: U_TOP/U_REG_A/Q
+Endpoint:   U_TOP/U_REG_B/D
+Path Group: clk
+Path Type:  max
+
+  Point                                    Incr     Path
+  ----------------------------------------------------------
+  clock clk (rise edge)                    0.00     0.00
+  U_TOP/U_REG_A/CQ                         0.09     0.09
+  U_TOP/U_COMB1/A                          0.01     0.10
+  U_TOP/U_COMB1/Z                          0.22     0.32
+  U_TOP/U_REG_B/D                          0.00     0.32
+  slack (VIOLATED)                        -0.10
+============================================================
+Startpoint: U_TOP/U_REG_C/Q
+Endpoint:   U_TOP/U_REG_B/D
+Path Group: clk
+Path Type:  max
+
+  U_TOP/U_REG_C/CQ                         0.09     0.09
+  U_TOP/U_COMB1/Z                          0.22     0.31
+  U_TOP/U_REG_B/D                          0.00     0.31
+  slack (VIOLATED)                        -0.05
+============================================================
+Startpoint: U_TOP/U_REG_E/Q
+Endpoint:   U_TOP/U_REG_F/D
+Path Group: clk
+
+  U_TOP/U_COMB1/Z                          0.22     0.31
+  slack (MET)                              0.20
+============================================================
+"""
+
+
+def test_parser_collects_point_pins():
+    paths = parse_timing_report(REPORT)
+    assert paths[0].points == [
+        "U_TOP/U_REG_A/CQ",
+        "U_TOP/U_COMB1/A",
+        "U_TOP/U_COMB1/Z",
+        "U_TOP/U_REG_B/D",
+    ]
+    # MET paths don't keep their point table
+    assert paths[2].points == []
+    # pins shared by several paths are one interned string
+    assert paths[0].points[2] is paths[1].points[1]
+
+
+def test_cell_of_pin():
+    assert cell_of_pin("U_TOP/U_COMB1/Z") == "U_TOP/U_COMB1"
+    assert cell_of_pin("PORT") == "PORT"
+
+
+def test_hotspots_count_each_cell_once_per_violating_path():
+    hotspots = find_hotspots(parse_timing_report(REPORT))
+    by_cell = {h.cell: h for h in hotspots}
+
+    # MET path is ignored; U_COMB1 has two pins on path 1 but counts once
+    assert by_cell["U_TOP/U_COMB1"].path_count == 2
+    assert abs(by_cell["U_TOP/U_COMB1"].tns - (-0.15)) < 1e-9
+    assert by_cell["U_TOP/U_COMB1"].wns == -0.10
+    assert by_cell["U_TOP/U_REG_A"].path_count == 1
+
+    assert [h.cell for h in hotspots[:2]] == ["U_TOP/U_COMB1", "U_TOP/U_REG_B"]
+
+
+def test_counter_interns_names():
+    c = HotspotCounter()
+    c.add(-0.1, ["U_A/Z", "U_B/Z"])
+    c.add(-0.2, ["U_A/Z", "U_A/B"])
+    assert c.n_paths == 2
+    assert c.n_cells == 2
+    assert [h.cell for h in c.ranked(top=1)] == ["U_A"]
@@ -0,0 +1,55 @@
+import pandas as pd
+import pytest
+
+from analysis.sampling import downsample_paths, weighted_counts
+
+
+def _df():
+    rows = []
+    for g, n in (("g1", 1000), ("g2", 30)):
+        for i in range(n):
+            rows.append(
+                {
+                    "startpoint": f"{g}/S{i}",
+                    "endpoint": f"{g}/E{i}",
+                    "path_group": g,
+                    "slack": 0.1 + (i % 50) / 100,
+                }
+            )
+    for i in range(20):
+        rows.append(
+            {
+                "startpoint": f"V{i}",
+                "endpoint": f"VE{i}",
+                "path_group": "g1",
+                "slack": 0.04 - 0.01 * i,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def test_tail_kept_exactly_and_bulk_weighted():
+    df = _df()
+    out = downsample_paths(df, near_critical=0.05, per_group=100)
+
+    tail = out[out["slack"] < 0.05]
+    assert len(tail) == (df["slack"] < 0.05).sum()
+    assert (tail["weight"] == 1.0).all()
+
+    # weighted counts reproduce per-group totals
+    for g, n in df.groupby("path_group").size().items():
+        assert out.loc[out["path_group"] == g, "weight"].sum() == pytest.approx(n)
+
+    assert weighted_counts(out) == pytest.approx(len(df))
+    assert weighted_counts(df) == len(df)
+
+    # small group is kept whole
+    assert (out.loc[out["path_group"] == "g2", "weight"] == 1.0).all()
+    assert len(out) == 20 + 100 + 30
+
+
+def test_sample_is_deterministic():
+    df = _df()
+    a = downsample_paths(df, per_group=50)
+    b = downsample_paths(df.sample(frac=1.0, random_state=1), per_group=50)
+    assert sorted(a["startpoint"]) == sorted(b["startpoint"])
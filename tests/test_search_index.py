@@ -0,0 +1,59 @@
+from parser.timing_parser import parse_timing_report
+
+import pandas as pd
+
+from analysis.search_index import NameIndex, PathSearchIndex, matches
+from edaflow import _paths_to_df, filter_paths
+
+NAMES = [
+    "U_TOP/U_REG_A/D (rising edge-triggered flip-flop)",
+    "U_TOP/U_REG_B/D",
+    "U_TOP/U_OUTPORT (output port)",
+    "U_TOP/U_REG_A/D (rising edge-triggered flip-flop)",
+    "U_TOP/U_MEM/U_REG_C/CK",
+]
+
+
+def _linear(pattern):
+    return [i for i, n in enumerate(NAMES) if matches(pattern, n)]
+
+
+def test_queries_match_linear_scan():
+    idx = NameIndex(NAMES)
+    assert len(idx) == 4  # names are interned
+    patterns = ["U_REG", "REG_A/D", "PORT", "nope", "/D", "*/U_REG_*/D", "*_REG_?/*", "U_TOP/*"]
+    for pattern in patterns:
+        assert idx.search(pattern) == _linear(pattern), pattern
+
+    assert idx.glob("*/U_REG_*/D") == [0, 1, 3]
+    assert idx.prefix("U_TOP/U_REG") == [0, 1, 3]
+    assert idx.substring("U_MEM") == [4]
+
+
+def test_bus_bit_brackets_are_literal():
+    names = ["U_TOP/data_reg[3]/D", "U_TOP/data_reg3/D", "U_TOP/data_reg[13]/D"]
+    idx = NameIndex(names)
+    assert idx.search("data_reg[3]") == [0]
+    assert idx.search("*data_reg[3]*") == [0]
+    assert idx.search("U_TOP/data_reg[?]/D") == [0]
+    assert matches("data_reg[3]", names[0]) and not matches("data_reg[3]", names[1])
+
+
+def test_roundtrip(tmp_path):
+    df = pd.DataFrame({"startpoint": NAMES, "endpoint": list(reversed(NAMES))})
+    path = PathSearchIndex.from_df(df).save(tmp_path / "search_index.json")
+    loaded = PathSearchIndex.load(path)
+    assert loaded.search("endpoint", "*/D") == [1, 3, 4]
+    assert loaded.search("startpoint", "U_MEM") == [4]
+
+
+def test_filter_paths_by_endpoint():
+    report = open("reports/timing_report.txt", encoding="utf-8").read()
+    df = _paths_to_df(parse_timing_report(report))
+
+    dfv = filter_paths(df, group=None, violations_only=False, endpoint="*/U_REG_*/D")
+    assert len(dfv) == 3
+    assert dfv["slack"].tolist() == sorted(dfv["slack"].tolist())
+
+    dfv = filter_paths(df, group="clk_io", violations_only=True, endpoint="PORT")
+    assert dfv["endpoint"].tolist() == ["U_TOP/U_OUTPORT (output port)"]
@@ -0,0 +1,120 @@
+import asyncio
+import os
+import shutil
+
+import pytest
+
+from server.client import fetch_json, load_artifacts_from_server
+from server.daemon import EdaflowServer, ReportIndex
+
+
+@pytest.fixture
+def report(tmp_path):
+    dst = tmp_path / "timing_report.txt"
+    shutil.copy("reports/timing_report.txt", dst)
+    return dst
+
+
+def test_index_queries(report):
+    idx = ReportIndex(report)
+
+    top = idx.query_paths(None, violations_only=True, offset=0, limit=2)
+    assert top["total"] == 3
+    assert [r["slack"] for r in top["rows"]] == [-0.15, -0.06]
+
+    sample = idx.query_paths(None, False, offset=0, limit=None, sampled=True)
+    assert [r["slack"] for r in sample["rows"]] == [-0.15, -0.06, -0.06, 0.15]
+
+    g = idx.query_paths("clk_core", violations_only=False, offset=0, limit=None)
+    assert [r["slack"] for r in g["rows"]] == [-0.06, 0.15]
+    assert idx.query_paths("nope", False, 0, None)["total"] == 0
+
+    stats = idx.stats("clk_io", violations_only=False)
+    assert stats["violated_paths"] == 2
+    assert stats["wns"] == -0.15
+
+    detail = idx.path_detail(top["rows"][0]["path_id"])
+    assert detail["endpoint"].startswith("U_TOP/U_OUTPORT")
+
+    md = idx.snapshot.summary_md
+    assert "No cells found" not in md and "| U_TOP/" in md
+    # the daemon writes no files, so the markdown must not point at any
+    assert "hotspots.csv" not in md and "search_index.json" not in md
+
+
+def test_index_reloads_when_report_changes(report):
+    idx = ReportIndex(report)
+    assert not idx.refresh()
+
+    text = report.read_text(encoding="utf-8")
+    report.write_text(text.split("====")[0], encoding="utf-8")
+    os.utime(report, ns=(0, 0))
+    assert idx.refresh()
+    assert len(idx.snapshot.paths) == 1
+
+
+def test_failed_reload_keeps_snapshot_and_retries(report):
+    async def scenario():
+        srv = EdaflowServer([report], workers=1, poll_interval=60)
+        try:
+            idx = srv.indexes[report.name]
+            before = idx.snapshot
+
+            report.write_bytes(b"Startpoint: \xff\xfe half-written")
+            await srv.refresh_all()  # UnicodeDecodeError is logged, not raised
+            assert idx.snapshot is before
+
+            report.write_text(open("reports/timing_report.txt", encoding="utf-8").read()[:400])
+            await srv.refresh_all()
+            assert idx.snapshot is not before
+        finally:
+            srv.pool.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_duplicate_report_names_are_rejected(report, tmp_path):
+    other = tmp_path / "b" / report.name
+    other.parent.mkdir()
+    shutil.copy(report, other)
+    with pytest.raises(ValueError, match="duplicate report name"):
+        EdaflowServer([report, other], workers=1)
+
+
+def test_index_handles_report_without_paths(tmp_path):
+    empty = tmp_path / "empty.txt"
+    empty.write_text("# nothing parsed yet\n", encoding="utf-8")
+    idx = ReportIndex(empty)
+
+    assert list(idx.snapshot.df_sorted.columns)[:2] == ["path_id", "startpoint"]
+    assert idx.stats(None, violations_only=False)["total_paths"] == 0
+    assert idx.stats("clk_io", violations_only=True)["wns"] == 0.0
+    assert idx.query_paths(None, violations_only=True, offset=0, limit=None)["rows"] == []
+
+
+def test_http_api(report):
+    async def scenario():
+        srv = EdaflowServer([report], workers=2, poll_interval=60)
+        server = await srv.start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        base = f"http://127.0.0.1:{port}"
+        loop = asyncio.get_running_loop()
+        try:
+            summary = await loop.run_in_executor(None, fetch_json, base, "/summary")
+            topk = await loop.run_in_executor(
+                None, lambda: fetch_json(base, "/topk", k=1, group="clk_io")
+            )
+            artifacts = await loop.run_in_executor(None, load_artifacts_from_server, base)
+            with pytest.raises(RuntimeError):
+                await loop.run_in_executor(None, fetch_json, base, "/paths/99")
+        finally:
+            server.close()
+            srv.pool.shutdown()
+        return summary, topk, artifacts
+
+    summary, topk, artifacts = asyncio.run(scenario())
+    assert summary["overall"]["violated_paths"] == 3
+    assert [r["slack"] for r in topk["rows"]] == [-0.15]
+    # the dashboard gets the sample by default (all 4 paths here are kept, weight 1)
+    assert artifacts["sampled"] and artifacts["df_all"]["weight"].tolist() == [1.0] * 4
+    assert "Signoff Summary" in artifacts["md"]
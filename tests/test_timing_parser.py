@@ -37,3 +37,11 @@ Path Type:  max
 """
     paths = parse_timing_report(report)
     assert len(paths) == 0
+
+
+def test_iter_timing_paths_matches_full_parse():
+    from parser.timing_parser import iter_timing_paths, load_report
+
+    text = load_report("reports/timing_report.txt")
+    streamed = list(iter_timing_paths(text.splitlines(keepends=True)))
+    assert streamed == parse_timing_report(text)
@@ -0,0 +1,52 @@
+from parser.timing_parser import TimingPath
+
+from ml.violation_classifier import (
+    LABELS,
+    ViolationClassifier,
+    iter_path_batches,
+    path_tokens,
+    train_incremental,
+)
+
+
+def test_path_tokens_hierarchy_and_slack_bin():
+    p = TimingPath(
+        "U_TOP/U_REG_A/Q (rising edge-triggered flip-flop)",
+        "U_TOP/U_REG_B/D",
+        "clk_core",
+        "max",
+        -0.06,
+        "VIOLATED",
+        ["transition violation suspected"],
+    )
+    tokens = path_tokens(p)
+    assert "ep=U_TOP" in tokens
+    assert "ep=U_TOP/U_REG_B" in tokens
+    assert "ep_pin=D" in tokens
+    assert "sp=U_TOP/U_REG_A/Q" in tokens
+    assert "group=clk_core" in tokens
+    assert "note=transition" in tokens
+    assert "slack_bin=-2" in tokens
+
+
+def test_iter_path_batches_sizes():
+    batches = list(iter_path_batches(["reports/timing_report.txt"] * 3, batch_size=4))
+    assert [len(b) for b in batches] == [4, 4, 4]
+
+
+def test_incremental_training_and_model_cache(tmp_path):
+    model_path = tmp_path / "clf.pkl"
+    reports = ["reports/timing_report.txt"]
+
+    clf = train_incremental(reports, model_path, batch_size=2)
+    assert model_path.exists()
+    assert clf.n_seen == 4
+
+    # second run resumes from the cached model
+    clf2 = train_incremental(reports, model_path, batch_size=2)
+    assert clf2.n_seen == 8
+
+    batch = next(iter_path_batches(reports, batch_size=16))
+    preds = ViolationClassifier.load(model_path).predict(batch)
+    assert len(preds) == len(batch)
+    assert set(preds) <= set(LABELS)
@@ -1,5 +1,10 @@
 from parser.timing_parser import TimingPath
-from parser.violation_summary import compute_stats, infer_violation_type
+from parser.violation_summary import (
+    SummaryAccumulator,
+    compute_stats,
+    infer_violation_type,
+    summarize,
+)
 
 
 def test_compute_stats_wns_tns():
@@ -30,3 +35,17 @@ def test_infer_violation_type_from_notes():
     assert infer_violation_type(p2) == "max_capacitance"
     assert infer_violation_type(p3) == "setup"
     assert infer_violation_type(p4) == "none"
+
+
+def test_summary_accumulator_matches_summarize():
+    paths = [
+        TimingPath("A", "B", "g1", "max", -0.10, "VIOLATED", ["transition violation"]),
+        TimingPath("C", "D", "g2", "max", 0.20, "MET", []),
+        TimingPath("E", "F", "g1", "max", -0.05, "VIOLATED", []),
+        TimingPath("G", "H", "g1", "max", 0.30, "MET", []),
+    ]
+    acc = SummaryAccumulator()
+    assert acc.result() == summarize([])
+    for p in paths:
+        acc.add(p)
+    assert acc.result() == summarize(paths)
@@ -1,21 +1,25 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Optional
 
 import matplotlib.pyplot as plt
 
 
 def plot_slack_distribution(
-    slacks: Iterable[float], out_path: str | Path, title: str = "Slack Distribution"
+    slacks: Iterable[float],
+    out_path: str | Path,
+    title: str = "Slack Distribution",
+    weights: Optional[Iterable[float]] = None,
 ) -> Path:
+    """weights: per-slack counts, e.g. the "weight" column of a downsampled view."""
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     slacks = list(slacks)
 
     plt.figure()
-    plt.hist(slacks, bins=12)
+    plt.hist(slacks, bins=12, weights=None if weights is None else list(weights))
     plt.title(title)
     plt.xlabel("Slack (ns)")
     plt.ylabel("Count")